@@ -1,4 +1,10 @@
-from fastapi import APIRouter, Depends
+import math
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, Request
+from app.core.config import settings
+from app.core.rate_limit import AuthRateLimiter
+from app.core.util import error_response
 from app.enums.user_type import UserType
 from app.models.user import User
 from app.services.mongodb_service.mdb_user_service import MDBUserService
@@ -19,33 +25,88 @@ def get_user_service() -> UserService:
     return UserService(mdb_user_service)
 
 
+def client_ip(request: Request) -> str | None:
+    """
+    Returns the caller's address, taken from X-Forwarded-For when behind trusted proxies.
+
+    Proxies append the address they received the request from, so only the
+    entries added by the trusted_proxy_hops proxies, counted from the right,
+    can be trusted; anything left of them was written by the client.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        str | None: The client IP, None if unknown
+    """
+    if settings.trust_forwarded_for:
+        forwarded = [
+            entry.strip() for header in request.headers.getlist("X-Forwarded-For") for entry in header.split(",")
+        ]
+        forwarded = [entry for entry in forwarded if entry]
+        if len(forwarded) >= settings.trusted_proxy_hops >= 1:
+            return forwarded[-settings.trusted_proxy_hops]
+    return request.client.host if request.client else None
+
+
+async def throttled(request: Request, email: str | None = None):
+    """
+    Applies the per-IP and per-email token buckets before any password is hashed.
+
+    Args:
+        request: The incoming request
+        email: The email address whose failed logins to check, if any
+
+    Returns:
+        JSONResponse | None: A 429 response with Retry-After if throttled, None otherwise
+    """
+    retry_after = await AuthRateLimiter.check(client_ip(request), email)
+    if not retry_after:
+        return None
+    return error_response(
+        "Too many attempts, please retry later.",
+        HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
+
+
 @router.post("/signup/{user_type}")
-async def signup(user_type: UserType, user: User, user_service: UserService = Depends(get_user_service)):
+async def signup(user_type: UserType, user: User, request: Request,
+                 user_service: UserService = Depends(get_user_service)):
     """
     Registers a new user.
     
     Args:
         user_type: The type of user (e.g., ADMIN, USER)
         user: The user registration data
+        request: The incoming request
         user_service: Service for user operations
         
     Returns:
         dict: The result of the creation operation
     """
-    return await user_service.create_user(user.email, user.password, user_type)
+    return await throttled(request) or await user_service.create_user(
+        user.email, user.password, user_type
+    )
 
 
 @router.post("/login")
-async def login(user: User, user_service: UserService = Depends(get_user_service)):
+async def login(user: User, request: Request, user_service: UserService = Depends(get_user_service)):
     """
     Authenticates a user and returns a token.
     
     Args:
         user: The login credentials
+        request: The incoming request
         user_service: Service for user operations
         
     Returns:
         dict: Authentication result containing the token
     """
-    return await user_service.authenticate_user(user.email, user.password)
+    response = await throttled(request, user.email) or await user_service.authenticate_user(
+        user.email, user.password
+    )
+    if response.status_code == HTTPStatus.UNAUTHORIZED:
+        await AuthRateLimiter.record_failure(client_ip(request), user.email)
+    return response
 
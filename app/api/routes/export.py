@@ -0,0 +1,52 @@
+from datetime import datetime
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.security import Security
+from app.core.util import error_response
+from app.services.mongodb_service.mdb_game_service import MDBGameService
+
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+def get_game_service() -> MDBGameService:
+    """
+    Dependency to provide an MDBGameService instance.
+
+    Returns:
+        MDBGameService: Service bound to the application database
+    """
+    return MDBGameService()
+
+
+@router.get("/games")
+async def export_games(
+        updated_since: datetime | None = None,
+        batch_size: int = Query(settings.export_batch_size, ge=1, le=settings.export_max_batch_size),
+        authorization: str | None = Header(None),
+        game_service: MDBGameService = Depends(get_game_service),
+):
+    """
+    Streams the game catalog as newline-delimited JSON.
+
+    Args:
+        updated_since: Only export games updated at or after this time
+        batch_size: Number of games fetched from MongoDB per round trip
+        authorization: Bearer token of the caller
+        game_service: Service for game export
+
+    Returns:
+        StreamingResponse: One JSON object per line, ordered by updated_at
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    payload = Security.verify_token_cached(token) if scheme.lower() == "bearer" and token else None
+    if payload is None:
+        return error_response("Unauthorized.", HTTPStatus.UNAUTHORIZED)
+
+    return StreamingResponse(
+        game_service.export_games(updated_since, batch_size), media_type="application/x-ndjson"
+    )
@@ -0,0 +1,30 @@
+import hmac
+from http import HTTPStatus
+
+from fastapi import APIRouter, Header
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.metrics import REGISTRY
+from app.core.util import error_response
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(authorization: str | None = Header(None)):
+    """
+    Exposes application metrics in the Prometheus text format.
+
+    Args:
+        authorization: Bearer token of the scraper, checked when METRICS_TOKEN is set
+
+    Returns:
+        PlainTextResponse: The current value of every registered metric
+    """
+    if settings.metrics_token:
+        scheme, _, token = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), settings.metrics_token.encode()):
+            return error_response("Unauthorized.", HTTPStatus.UNAUTHORIZED)
+
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
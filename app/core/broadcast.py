@@ -0,0 +1,48 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Broadcaster(Generic[T]):
+    """
+    In-process fan-out of events to every current subscriber.
+
+    Each subscriber gets a bounded queue. A subscriber that falls behind loses
+    its oldest events rather than blocking publishers or growing without bound.
+    """
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: T) -> None:
+        """
+        Delivers an event to every subscriber without waiting.
+
+        Args:
+            event: The event to deliver
+        """
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def subscribe(self) -> AsyncIterator[T]:
+        """
+        Yields events published from now on, until the consumer stops iterating.
+
+        Yields:
+            T: The published events, in order
+        """
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._subscribers.add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers.discard(queue)
@@ -0,0 +1,121 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Bounded in-process LRU cache whose entries expire after a time-to-live.
+    A maxsize of 0 disables the cache.
+
+    Every invalidation advances a generation counter. A reader captures
+    generation() before fetching and passes it to set(), which then skips
+    the write if the key was invalidated while the fetch was running, so a
+    read started before a write cannot put the old value back. The
+    generations of the last maxsize invalidated keys are remembered; past
+    that, writes captured before the oldest one forgotten are skipped.
+    """
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self._invalidated: OrderedDict[Hashable, int] = OrderedDict()
+        self._forgotten_generation = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Returns a cached value and marks it as recently used.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Any | None: The cached value, None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def generation(self) -> int:
+        """
+        Returns the current invalidation generation, to capture before fetching a value.
+
+        Returns:
+            int: The number of invalidations so far
+        """
+        return self._generation
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None, generation: int | None = None) -> None:
+        """
+        Stores a value, evicting the least recently used entry when full.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+            ttl: Lifetime of this entry in seconds, defaults to the cache TTL
+            generation: The generation captured before the value was fetched; the value
+                is dropped if the key was invalidated since
+        """
+        if self.maxsize <= 0:
+            return
+        if generation is not None and (
+            generation < self._forgotten_generation or self._invalidated.get(key, 0) > generation
+        ):
+            return
+
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drops a single entry, if present.
+
+        Args:
+            key: The cache key
+        """
+        self._entries.pop(key, None)
+        if self.maxsize <= 0:
+            return
+
+        self._generation += 1
+        self._invalidated[key] = self._generation
+        self._invalidated.move_to_end(key)
+        while len(self._invalidated) > self.maxsize:
+            _, self._forgotten_generation = self._invalidated.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        self._entries.clear()
+        self._generation += 1
+        self._invalidated.clear()
+        self._forgotten_generation = self._generation
+
+    @property
+    def enabled(self) -> bool:
+        """Checks if the cache stores anything at all."""
+        return self.maxsize > 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict[str, int]: Hits, misses and current number of entries
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -0,0 +1,60 @@
+import time
+
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+from app.core.database import MongoDB
+
+
+class CatalogVersion:
+    """
+    Monotonically increasing version of the game catalog, shared by all workers.
+
+    The counter lives in the counters collection. Each worker keeps the last
+    value it saw and re-reads it at most every catalog_version_refresh_seconds,
+    so checking the version usually costs no round trip. Bumps made by this
+    worker are visible to it immediately.
+    """
+    _version: int | None = None
+    _fetched_at: float = 0.0
+
+    @classmethod
+    async def current(cls) -> int:
+        """
+        Returns the catalog version, refreshing the local copy when it is stale.
+
+        Returns:
+            int: The version, 0 if the catalog was never modified
+        """
+        if cls._version is None or time.monotonic() - cls._fetched_at >= settings.catalog_version_refresh_seconds:
+            doc = await MongoDB.get_db().counters.find_one({"_id": "catalog"})
+            cls._remember(doc["version"] if doc else 0)
+        return cls._version
+
+    @classmethod
+    async def bump(cls) -> int:
+        """
+        Increments the catalog version after a write.
+
+        Returns:
+            int: The new version
+        """
+        doc = await MongoDB.get_db().counters.find_one_and_update(
+            {"_id": "catalog"},
+            {"$inc": {"version": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        cls._remember(doc["version"])
+        return cls._version
+
+    @classmethod
+    def expire(cls) -> None:
+        """Forces the next call to current() to read the version from MongoDB."""
+        cls._fetched_at = 0.0
+
+    @classmethod
+    def _remember(cls, version: int) -> None:
+        # Never go backwards when a slower read races a bump.
+        cls._version = version if cls._version is None else max(cls._version, version)
+        cls._fetched_at = time.monotonic()
@@ -5,9 +5,59 @@ class Settings(BaseSettings):
     app_name: str = "Funz App"
     mongo_uri: str = "mongodb://localhost:27017"
     mongo_db: str = "funz"
+    mongo_ensure_indexes_on_startup: bool = True
+    mongo_max_pool_size: int | None = None
+    mongo_min_pool_size: int | None = None
+    mongo_wait_queue_timeout_ms: int | None = None
+    mongo_server_selection_timeout_ms: int | None = None
+    mongo_compressors: str | None = None
+    mongo_write_concern: str | None = None
+    mongo_catalog_read_preference: str = "secondaryPreferred"
+    mongo_read_your_writes_seconds: float = 5.0
+    mongo_recent_writers_size: int = 10000
     jwt_secret: str = "appsecret"
     jwt_app_id: str = "appid"
     jwt_algorithm: str = "HS256"
+    games_page_size: int = 20
+    games_max_page_size: int = 100
+    game_lists_size: int = 50
+    game_lists_candidates: int = 1000
+    game_lists_refresh_seconds: float = 60.0
+    search_max_query_length: int = 200
+    bulk_max_items: int = 10000
+    bulk_chunk_size: int = 1000
+    export_batch_size: int = 500
+    export_max_batch_size: int = 5000
+    export_tombstone_ttl_seconds: int = 2592000
+    persisted_query_cache_size: int = 1000
+    persisted_query_ttl_seconds: float = 86400.0
+    game_cache_size: int = 1024
+    game_cache_ttl_seconds: float = 30.0
+    game_singleflight_enabled: bool = True
+    token_cache_size: int = 10000
+    token_cache_max_ttl_seconds: float = 300.0
+    password_hash_executor: str = "thread"
+    password_hash_workers: int | None = None
+    password_hash_max_pending: int = 64
+    password_hash_retry_after_seconds: int = 1
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = "memory"
+    rate_limit_memory_keys: int = 100000
+    auth_ip_burst: int = 20
+    auth_ip_per_second: float = 1.0
+    auth_email_burst: int = 5
+    auth_email_per_second: float = 0.05
+    trust_forwarded_for: bool = False
+    trusted_proxy_hops: int = 1
+    metrics_enabled: bool = True
+    metrics_token: str = ""
+    game_events_source: str = "local"
+    subscription_queue_size: int = 100
+    change_stream_retry_seconds: float = 5.0
+    catalog_version_refresh_seconds: float = 1.0
+    invalidation_backend: str = "memory"
+    invalidation_collection_bytes: int = 1048576
+    invalidation_retry_seconds: float = 1.0
 
 
 
@@ -1,5 +1,43 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReadPreference
+
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.metrics import MongoCommandMetrics
+
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
+
+def client_options() -> dict:
+    """
+    Builds the AsyncIOMotorClient keyword arguments from settings.
+
+    Options left unset are not passed, so the driver default or the value in
+    mongo_uri applies.
+
+    Returns:
+        dict: Keyword arguments for AsyncIOMotorClient
+    """
+    options = {
+        "maxPoolSize": settings.mongo_max_pool_size,
+        "minPoolSize": settings.mongo_min_pool_size,
+        "waitQueueTimeoutMS": settings.mongo_wait_queue_timeout_ms,
+        "serverSelectionTimeoutMS": settings.mongo_server_selection_timeout_ms,
+        "compressors": settings.mongo_compressors,
+    }
+    if settings.mongo_write_concern is not None:
+        w = settings.mongo_write_concern
+        options["w"] = int(w) if w.isdigit() else w
+    options = {key: value for key, value in options.items() if value is not None}
+    if settings.metrics_enabled:
+        options["event_listeners"] = [MongoCommandMetrics()]
+    return options
 
 
 class MongoDB:
@@ -7,6 +45,9 @@ class MongoDB:
     Singleton manager for MongoDB connection.
     """
     _client: AsyncIOMotorClient | None = None
+    _catalog_db = None
+    # Users who wrote within the read-your-writes window; their catalog reads stay on the primary.
+    _recent_writers: TTLCache = TTLCache(settings.mongo_recent_writers_size, settings.mongo_read_your_writes_seconds)
 
     @classmethod
     async def connect(cls):
@@ -15,7 +56,7 @@ class MongoDB:
         Should be called on app startup.
         """
         if cls._client is None:
-            cls._client = AsyncIOMotorClient(settings.mongo_uri)
+            cls._client = AsyncIOMotorClient(settings.mongo_uri, **client_options())
         return cls._client
 
     @classmethod
@@ -27,6 +68,7 @@ class MongoDB:
         if cls._client is not None:
             cls._client.close()
             cls._client = None
+            cls._catalog_db = None
 
     @classmethod
     def get_db(cls):
@@ -42,3 +84,48 @@ class MongoDB:
         if cls._client is None:
             raise RuntimeError("Mongo client is not initialized")
         return cls._client[settings.mongo_db] # type: ignore
+
+    @classmethod
+    def get_catalog_db(cls, user_id: str | None = None):
+        """
+        Retrieves the database instance for catalog reads.
+
+        Uses mongo_catalog_read_preference, so reads may be served by
+        secondaries, unless the user wrote within the read-your-writes window.
+
+        Args:
+            user_id: The ID of the reading user, if any
+
+        Returns:
+            Database: The AsyncIOMotorDatabase instance to read from
+
+        Raises:
+            RuntimeError: If client is not initialized
+            ValueError: If the configured read preference is unknown
+        """
+        if user_id is not None and cls._recent_writers.get(user_id):
+            return cls.get_db()
+
+        if cls._catalog_db is None:
+            if cls._client is None:
+                raise RuntimeError("Mongo client is not initialized")
+            try:
+                read_preference = READ_PREFERENCES[settings.mongo_catalog_read_preference]
+            except KeyError as e:
+                raise ValueError(
+                    f"Unknown read preference {settings.mongo_catalog_read_preference}, "
+                    f"expected one of {', '.join(READ_PREFERENCES)}"
+                ) from e
+            cls._catalog_db = cls._client.get_database(settings.mongo_db, read_preference=read_preference)
+        return cls._catalog_db
+
+    @classmethod
+    def record_write(cls, user_id: str | None) -> None:
+        """
+        Routes the user's catalog reads to the primary for the read-your-writes window.
+
+        Args:
+            user_id: The ID of the writing user, if any
+        """
+        if user_id is not None:
+            cls._recent_writers.set(user_id, True)
@@ -0,0 +1,110 @@
+import hashlib
+from http import HTTPStatus
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection, Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.catalog_version import CatalogVersion
+from app.core.security import Security
+
+# GET endpoints whose response only depends on the catalog, the URL and the caller.
+CATALOG_PATHS = frozenset({"/api/graphql", "/api/export/games"})
+# Only data responses are tagged, never e.g. the GraphiQL page.
+TAGGED_CONTENT_TYPES = frozenset({"application/json", "application/x-ndjson"})
+# Request state flag telling CatalogETagMiddleware not to tag the response.
+UNCACHEABLE = "catalog_uncacheable"
+
+
+def mark_uncacheable(request: HTTPConnection) -> None:
+    """
+    Keeps the response to a request from being tagged, e.g. because it reports an error.
+
+    Args:
+        request: The request being answered
+    """
+    setattr(request.state, UNCACHEABLE, True)
+
+
+def catalog_etag(version: int, request: Request) -> str:
+    """
+    Builds the entity tag of a catalog read.
+
+    Args:
+        version: The catalog version the response is computed from
+        request: The request, whose URL query and caller are part of the tag
+
+    Returns:
+        str: A quoted strong entity tag
+    """
+    authorization = request.headers.get("Authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    payload = Security.verify_token_cached(token) if scheme.lower() == "bearer" and token else None
+    caller = f"{payload.get('sub')}:{payload.get('uid')}" if payload else ""
+
+    digest = hashlib.sha256(f"{request.url.path}?{request.url.query}|{caller}".encode()).hexdigest()[:16]
+    return f'"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Checks an If-None-Match header against an entity tag, using weak comparison.
+
+    Args:
+        if_none_match: The header value, a list of tags or *
+        etag: The current entity tag
+
+    Returns:
+        bool: True if the client already has the current representation
+    """
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+class CatalogETagMiddleware:
+    """
+    Adds ETags to catalog reads and answers matching conditional GETs with 304.
+
+    The version is read before the response is computed. A write that lands
+    meanwhile therefore leaves the response tagged with an older version, and
+    the next conditional request fetches it again instead of keeping stale data.
+    Responses marked with mark_uncacheable() are left untagged.
+    Written as plain ASGI so requests it does not concern pay no overhead.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in CATALOG_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        # Strawberry serves the GraphiQL page to GETs without a query that accept HTML,
+        # even when they carry a persisted query hash.
+        accept = request.headers.get("Accept", "")
+        if request.url.path == "/api/graphql" and "query" not in request.query_params and (
+                "extensions" not in request.query_params or "text/html" in accept or "*/*" in accept
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        etag = catalog_etag(await CatalogVersion.current(), request)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("If-None-Match", ""), etag):
+            await Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)(scope, receive, send)
+            return
+
+        async def send_with_etag(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start" and message["status"] == HTTPStatus.OK
+                and not scope.get("state", {}).get(UNCACHEABLE)
+            ):
+                response_headers = MutableHeaders(scope=message)
+                content_type = response_headers.get("content-type", "").split(";")[0].strip().lower()
+                if content_type in TAGGED_CONTENT_TYPES:
+                    response_headers.update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
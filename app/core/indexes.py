@@ -0,0 +1,135 @@
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+from app.core.config import settings
+from app.core.database import MongoDB
+from app.core.logger import logger
+
+# Every secondary index the application relies on, per collection.
+INDEXES: dict[str, list[IndexModel]] = {
+    "users": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+    ],
+    "games": [
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id"),
+        IndexModel([("like_count", DESCENDING), ("_id", DESCENDING)], name="like_count_id"),
+        IndexModel([("updated_at", ASCENDING), ("_id", ASCENDING)], name="updated_at_id"),
+        IndexModel([("type", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="type"),
+        IndexModel([("type", ASCENDING), ("like_count", DESCENDING), ("_id", DESCENDING)], name="type_like_count"),
+        IndexModel(
+            [("publisher_name", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="publisher_name"
+        ),
+        IndexModel(
+            [("publisher_name", ASCENDING), ("like_count", DESCENDING), ("_id", DESCENDING)],
+            name="publisher_name_like_count"
+        ),
+        IndexModel([("is_featured", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="is_featured"),
+        IndexModel(
+            [("is_featured", ASCENDING), ("like_count", DESCENDING), ("_id", DESCENDING)], name="is_featured_like_count"
+        ),
+        IndexModel(
+            [("name", TEXT), ("publisher_name", TEXT), ("description", TEXT)],
+            name="text_search",
+            weights={"name": 10, "publisher_name": 5, "description": 1},
+            default_language="english",
+        ),
+    ],
+    "game_likes": [
+        IndexModel([("game_id", ASCENDING), ("user_id", ASCENDING)], name="game_id_user_id", unique=True),
+        IndexModel(
+            [("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="user_id_created_at"
+        ),
+        IndexModel([("created_at", DESCENDING), ("game_id", ASCENDING)], name="created_at_game_id"),
+    ],
+    "deleted_games": [
+        IndexModel(
+            [("deleted_at", ASCENDING)], name="deleted_at_ttl", expireAfterSeconds=settings.export_tombstone_ttl_seconds
+        ),
+    ],
+    "rate_limits": [
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+}
+
+
+def _matches(existing: dict, declared: dict) -> bool:
+    """
+    Checks if an existing index has the key and options of its declaration.
+
+    Args:
+        existing: Index description returned by index_information()
+        declared: IndexModel.document of the declared index
+
+    Returns:
+        bool: True if the existing index can be kept as is
+    """
+    if TEXT in declared["key"].values():
+        # Text indexes are reported as _fts/_ftsx keys, with the fields in the weights.
+        declared_weights = declared.get("weights") or {}
+        weights = {field: declared_weights.get(field, 1) for field, kind in declared["key"].items() if kind == TEXT}
+        language = declared.get("default_language", "english")
+        return dict(existing.get("weights") or {}) == weights and existing.get("default_language") == language
+    if list(existing["key"]) != list(declared["key"].items()):
+        return False
+    if existing.get("expireAfterSeconds") != declared.get("expireAfterSeconds"):
+        return False
+    return all(bool(existing.get(option)) == bool(declared.get(option)) for option in ("unique", "sparse"))
+
+
+# Reported by drop_index when another process dropped the index first.
+INDEX_NOT_FOUND = 27
+
+
+async def ensure_indexes(db=None, rebuild: bool = True) -> None:
+    """
+    Creates missing indexes and rebuilds the ones whose definition changed.
+
+    Indexes that are not declared in INDEXES are left alone. A failure on one
+    index is logged and does not stop the others.
+
+    Args:
+        db: The AsyncIOMotorDatabase to reconcile, defaults to the application database
+        rebuild: Drop and recreate changed indexes; when False they are only reported
+    """
+    db = db if db is not None else MongoDB.get_db()
+    for collection_name, models in INDEXES.items():
+        collection = db[collection_name]
+        existing = await collection.index_information()
+        for model in models:
+            declared = model.document
+            name = declared["name"]
+            if name in existing:
+                if _matches(existing[name], declared):
+                    continue
+                if not rebuild:
+                    logger.warning(
+                        f"Index {collection_name}.{name} differs from its declaration; "
+                        "run python -m app.migrations indexes to rebuild it"
+                    )
+                    continue
+
+            try:
+                if name in existing:
+                    logger.info(f"Rebuilding index {collection_name}.{name}")
+                    try:
+                        await collection.drop_index(name)
+                    except OperationFailure as e:
+                        if e.code != INDEX_NOT_FOUND:
+                            raise
+                await collection.create_indexes([model])
+                logger.info(f"Created index {collection_name}.{name}")
+            except OperationFailure as e:
+                logger.error(f"Failed to create index {collection_name}.{name}: {e}")
+
+
+async def ensure_indexes_on_startup() -> None:
+    """
+    Startup hook creating missing indexes, unless disabled in settings.
+    Should be registered after MongoDB.connect.
+
+    Changed indexes are only reported: several workers starting together
+    would race to drop and rebuild them, so that is left to
+    python -m app.migrations indexes.
+    """
+    if settings.mongo_ensure_indexes_on_startup:
+        await ensure_indexes(rebuild=False)
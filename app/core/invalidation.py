@@ -0,0 +1,224 @@
+import asyncio
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Protocol
+
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid, PyMongoError
+
+from app.core.broadcast import Broadcaster
+from app.core.config import settings
+from app.core.database import MongoDB
+from app.core.logger import logger
+from app.core.metrics import INVALIDATIONS
+from app.enums.invalidation_scope import InvalidationScope
+
+COLLECTION = "invalidations"
+
+
+@dataclass(frozen=True)
+class Invalidation:
+    """
+    Keys of a scope that changed, and the worker that changed them.
+    """
+    scope: InvalidationScope
+    keys: tuple[str, ...]
+    origin: str
+
+
+class InvalidationBackend(Protocol):
+    """
+    Transport of invalidation messages between workers.
+    """
+    async def publish(self, message: Invalidation) -> None:
+        """
+        Sends a message to every worker listening, the sender included.
+
+        Args:
+            message: The message to send
+        """
+        ...
+
+    def listen(self) -> AsyncIterator[Invalidation]:
+        """
+        Yields the messages published from now on.
+
+        Yields:
+            Invalidation: The messages, in publication order
+        """
+        ...
+
+
+class MemoryInvalidationBackend:
+    """
+    Messages delivered within this process only. Enough for a single worker,
+    and lets tests run several buses against one backend.
+    """
+    def __init__(self, queue_size: int = 1000):
+        self._broadcaster: Broadcaster[Invalidation] = Broadcaster(queue_size)
+
+    async def publish(self, message: Invalidation) -> None:
+        self._broadcaster.publish(message)
+
+    def listen(self) -> AsyncIterator[Invalidation]:
+        return self._broadcaster.subscribe()
+
+
+class MongoInvalidationBackend:
+    """
+    Messages appended to the invalidations capped collection and tailed by every worker.
+
+    Unlike change streams, tailable cursors also work on standalone servers.
+    The collection keeps only the most recent invalidation_collection_bytes
+    of messages. After a failure, listen() resumes after the last message it
+    yielded. If that message has already been overwritten, it replays the
+    whole collection, which is safe because invalidations are idempotent.
+    """
+    def __init__(self, collection_bytes: int):
+        self.collection_bytes = collection_bytes
+        self._last_id = None
+        self._started = False
+
+    async def _collection(self):
+        db = MongoDB.get_db()
+        try:
+            await db.create_collection(COLLECTION, capped=True, size=self.collection_bytes)
+        except CollectionInvalid:
+            pass
+        return db[COLLECTION]
+
+    async def publish(self, message: Invalidation) -> None:
+        await MongoDB.get_db()[COLLECTION].insert_one({
+            "scope": message.scope.value,
+            "keys": list(message.keys),
+            "origin": message.origin,
+            "created_at": datetime.now(timezone.utc),
+        })
+
+    async def listen(self) -> AsyncIterator[Invalidation]:
+        collection = await self._collection()
+        if not self._started:
+            newest = await collection.find_one({}, {"_id": 1}, sort=[("$natural", -1)])
+            self._last_id = newest["_id"] if newest else None
+            self._started = True
+
+        while True:
+            # _ids come from the clocks of many workers, so only the natural order tells what is new.
+            skipping = self._last_id is not None and await collection.count_documents({"_id": self._last_id}) > 0
+            cursor = collection.find({}, cursor_type=CursorType.TAILABLE_AWAIT)
+            try:
+                # Iteration stops whenever a getMore times out empty, while the cursor stays alive.
+                while cursor.alive:
+                    async for doc in cursor:
+                        if skipping:
+                            skipping = doc["_id"] != self._last_id
+                            continue
+                        self._last_id = doc["_id"]
+                        yield Invalidation(InvalidationScope(doc["scope"]), tuple(doc["keys"]), doc["origin"])
+            finally:
+                await cursor.close()
+            # A tailable cursor dies when the collection is empty; wait for the first message.
+            await asyncio.sleep(settings.invalidation_retry_seconds)
+
+
+def _create_backend() -> InvalidationBackend:
+    if settings.invalidation_backend == "mongo":
+        return MongoInvalidationBackend(settings.invalidation_collection_bytes)
+    return MemoryInvalidationBackend()
+
+
+class InvalidationBus:
+    """
+    Tells the other workers which cached entries a write made stale.
+
+    Writers drop their own entries directly and publish the changed keys;
+    every other worker runs the handlers subscribed to the scope. Messages
+    from this worker are ignored on the way back.
+    """
+    def __init__(self, backend: InvalidationBackend):
+        self.backend = backend
+        self.origin = uuid.uuid4().hex
+        self._handlers: dict[InvalidationScope, list[Callable[[tuple[str, ...]], None]]] = {}
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, scope: InvalidationScope, handler: Callable[[tuple[str, ...]], None]) -> None:
+        """
+        Registers a handler for keys invalidated by other workers.
+
+        Args:
+            scope: The scope to handle
+            handler: Called with the invalidated keys
+        """
+        handlers = self._handlers.setdefault(scope, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    async def publish(self, scope: InvalidationScope, keys: Iterable[str]) -> None:
+        """
+        Tells the other workers that keys changed.
+
+        Failures are logged rather than raised, since the write already happened;
+        the other workers then rely on their cache TTLs.
+
+        Args:
+            scope: The scope of the keys
+            keys: The changed keys
+        """
+        keys = tuple(keys)
+        if not keys:
+            return
+        try:
+            await self.backend.publish(Invalidation(scope, keys, self.origin))
+            INVALIDATIONS.inc(scope=scope.value, direction="sent")
+        except PyMongoError as e:
+            logger.error(f"Could not publish invalidation of {len(keys)} {scope.value}: {e}")
+
+    def dispatch(self, message: Invalidation) -> None:
+        """
+        Runs the handlers of a message published by another worker.
+
+        Args:
+            message: The received message
+        """
+        if message.origin == self.origin:
+            return
+        INVALIDATIONS.inc(scope=message.scope.value, direction="received")
+        for handler in self._handlers.get(message.scope, ()):
+            handler(message.keys)
+
+    async def run(self) -> None:
+        """Receives messages until cancelled, retrying after errors."""
+        while True:
+            try:
+                async for message in self.backend.listen():
+                    self.dispatch(message)
+            except (PyMongoError, ValueError) as e:
+                logger.error(f"Invalidation bus failed, retrying in {settings.invalidation_retry_seconds}s: {e}")
+                await asyncio.sleep(settings.invalidation_retry_seconds)
+
+    async def start(self) -> None:
+        """
+        Startup hook starting the listener.
+        Should be registered after MongoDB.connect.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """
+        Shutdown hook stopping the listener.
+        Should be registered before MongoDB.close.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Shared by every request handled by this worker.
+invalidation_bus = InvalidationBus(_create_backend())
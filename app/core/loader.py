@@ -1,16 +1,28 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from starlette.requests import HTTPConnection
 from strawberry.fastapi import GraphQLRouter
+from app.core import metrics
+from app.core.config import settings
 from app.core.database import MongoDB
+from app.core.etag import CatalogETagMiddleware
+from app.core.indexes import ensure_indexes_on_startup
+from app.core.invalidation import invalidation_bus
+from app.core.security import Security
 from app.graphql.context import GraphQLContext
 from app.graphql.schema import schema
-from app.api.routes import auth
+from app.graphql.persisted_queries import PersistedQueries
+from app.enums.invalidation_scope import InvalidationScope
+from app.services.graphql_service.game_events import start_game_events, stop_game_events
+from app.services.graphql_service.game_lists import start_game_lists, stop_game_lists
+from app.services.graphql_service.gql_game_service import GqlGameService
+from app.api.routes import auth, export, metrics as metrics_route
 
-async def get_context(request: Request):
+async def get_context(request: HTTPConnection):
     """
     Factory function for creating the GraphQL context.
     
     Args:
-        request: The FastAPI request object
+        request: The HTTP request or websocket
         
     Returns:
         GraphQLContext: The initialized context
@@ -28,10 +40,28 @@ def create_app() -> FastAPI:
         FastAPI: The initialized application instance
     """
     app = FastAPI()
+    app.add_middleware(CatalogETagMiddleware)
     app.add_event_handler("startup", MongoDB.connect)
+    app.add_event_handler("startup", ensure_indexes_on_startup)
+    app.add_event_handler("startup", start_game_events)
+    app.add_event_handler("startup", invalidation_bus.start)
+    app.add_event_handler("startup", start_game_lists)
+    app.add_event_handler("shutdown", stop_game_lists)
+    app.add_event_handler("shutdown", invalidation_bus.stop)
+    app.add_event_handler("shutdown", stop_game_events)
     app.add_event_handler("shutdown", MongoDB.close)
+    app.add_event_handler("shutdown", Security.shutdown_hash_executor)
+
+    invalidation_bus.subscribe(InvalidationScope.games, GqlGameService.forget_games)
 
     app.include_router(auth.router, prefix="/api")
+    app.include_router(export.router, prefix="/api")
+    if settings.metrics_enabled:
+        metrics.register_cache("games", GqlGameService.cache)
+        metrics.register_singleflight("games", GqlGameService.flights)
+        metrics.register_cache("tokens", Security.token_cache)
+        metrics.register_cache("persisted_queries", PersistedQueries.documents)
+        app.include_router(metrics_route.router)
     graphql_app = GraphQLRouter(schema, context_getter=get_context)
     app.include_router(graphql_app, prefix="/api/graphql")
     return app
\ No newline at end of file
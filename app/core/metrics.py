@@ -0,0 +1,298 @@
+import math
+import threading
+from abc import ABC, abstractmethod
+import time
+from collections.abc import Callable, Iterable
+
+from pymongo import monitoring
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    """
+    Base class of labelled metrics. Observations may come from any thread.
+    """
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        """
+        Returns the current samples of the metric.
+
+        Returns:
+            list[tuple[str, dict[str, str], float]]: Sample name, labels and value of each series
+        """
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for name, labels, value in self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing count.
+    """
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            values = dict(self._values)
+        return [(self.name, dict(zip(self.labelnames, key)), value) for key, value in values.items()]
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values over fixed cumulative buckets.
+    """
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            else:
+                counts[-1] += 1
+            total[0] += value
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            values = {key: (list(counts), total[0]) for key, (counts, total) in self._values.items()}
+
+        samples = []
+        for key, (counts, total) in values.items():
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class CallbackGauge(_Metric):
+    """
+    Gauge whose samples are read from a callback at scrape time.
+    """
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str],
+                 callback: Callable[[], Iterable[tuple[dict[str, str], float]]]):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        return [(self.name, labels, value) for labels, value in self.callback()]
+
+
+class CallbackCounter(CallbackGauge):
+    """
+    Counter whose samples are read at scrape time from a count kept elsewhere.
+    """
+    type_name = "counter"
+
+
+class Registry:
+    """
+    Collection of metrics rendered together in the Prometheus text format.
+    """
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """
+        Renders every registered metric.
+
+        Returns:
+            str: The exposition text, ending with a newline
+        """
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+REGISTRY = Registry()
+
+RESOLVER_LATENCY: Histogram = REGISTRY.register(Histogram(
+    "graphql_resolver_duration_seconds", "Latency of top-level GraphQL resolvers.", ("operation", "field")
+))
+RESOLVER_ERRORS: Counter = REGISTRY.register(Counter(
+    "graphql_resolver_errors_total", "Top-level GraphQL resolvers that raised or returned an ErrorResponse.",
+    ("operation", "field", "code")
+))
+MONGO_COMMAND_LATENCY: Histogram = REGISTRY.register(Histogram(
+    "mongo_command_duration_seconds", "Latency of MongoDB commands as seen by the driver.", ("command", "collection")
+))
+MONGO_COMMAND_FAILURES: Counter = REGISTRY.register(Counter(
+    "mongo_command_failures_total", "MongoDB commands that failed.", ("command", "collection")
+))
+PASSWORD_HASH_LATENCY: Histogram = REGISTRY.register(Histogram(
+    "password_hash_duration_seconds", "Time spent hashing or verifying a password in the worker pool.", ("operation",)
+))
+PASSWORD_HASH_WAIT: Histogram = REGISTRY.register(Histogram(
+    "password_hash_wait_seconds", "Time a password hash operation waited for a pool worker.",
+    ("operation",)
+))
+PASSWORD_HASH_REJECTED: Counter = REGISTRY.register(Counter(
+    "password_hash_rejected_total", "Password hash operations rejected because the pool was saturated.",
+    ("operation",)
+))
+RATE_LIMITED: Counter = REGISTRY.register(Counter(
+    "auth_rate_limited_total", "Auth requests rejected by a token bucket.", ("scope",)
+))
+INVALIDATIONS: Counter = REGISTRY.register(Counter(
+    "cache_invalidations_total", "Invalidation messages sent to or received from other workers.",
+    ("scope", "direction")
+))
+
+_caches: dict[str, object] = {}
+
+
+def register_cache(name: str, cache) -> None:
+    """
+    Exposes a TTLCache's hit, miss and size counters.
+
+    Args:
+        name: Value of the cache label
+        cache: The TTLCache
+    """
+    _caches[name] = cache
+
+
+def _cache_samples(stat: str) -> Callable[[], list[tuple[dict[str, str], float]]]:
+    return lambda: [({"cache": name}, cache.stats()[stat]) for name, cache in _caches.items()]
+
+
+REGISTRY.register(CallbackCounter("cache_hits_total", "Cache hits.", ("cache",), _cache_samples("hits")))
+REGISTRY.register(CallbackCounter("cache_misses_total", "Cache misses.", ("cache",), _cache_samples("misses")))
+REGISTRY.register(CallbackGauge("cache_entries", "Entries currently cached.", ("cache",), _cache_samples("size")))
+
+_flights: dict[str, object] = {}
+
+
+def register_singleflight(name: str, flight) -> None:
+    """
+    Exposes a SingleFlight group's call counters.
+
+    Args:
+        name: Value of the group label
+        flight: The SingleFlight
+    """
+    _flights[name] = flight
+
+
+def _flight_samples(stat: str) -> Callable[[], list[tuple[dict[str, str], float]]]:
+    return lambda: [({"group": name}, flight.stats()[stat]) for name, flight in _flights.items()]
+
+
+REGISTRY.register(CallbackCounter(
+    "singleflight_calls_total", "Reads issued by a single-flight group.", ("group",), _flight_samples("calls")
+))
+REGISTRY.register(CallbackCounter(
+    "singleflight_shared_total", "Reads that joined an identical read in flight.", ("group",),
+    _flight_samples("shared")
+))
+
+
+def timed_call(func, *args):
+    """
+    Calls func and measures how long it ran. Module-level so process pools can pickle it.
+
+    Args:
+        func: The function to call
+        *args: Arguments for func
+
+    Returns:
+        tuple: The result of func and the elapsed seconds
+    """
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    Command listener recording per-collection latency and failures.
+    Pass an instance in the client's event_listeners.
+    """
+    def __init__(self):
+        self._collections: dict[tuple, str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _collection(event: monitoring.CommandStartedEvent) -> str:
+        target = event.command.get(event.command_name)
+        if isinstance(target, str):
+            return target
+        collection = event.command.get("collection")
+        return collection if isinstance(collection, str) else ""
+
+    def _pop(self, event) -> str:
+        with self._lock:
+            return self._collections.pop((event.connection_id, event.request_id), "")
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        with self._lock:
+            self._collections[(event.connection_id, event.request_id)] = self._collection(event)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        MONGO_COMMAND_LATENCY.observe(
+            event.duration_micros / 1e6, command=event.command_name, collection=self._pop(event)
+        )
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        collection = self._pop(event)
+        MONGO_COMMAND_LATENCY.observe(event.duration_micros / 1e6, command=event.command_name, collection=collection)
+        MONGO_COMMAND_FAILURES.inc(command=event.command_name, collection=collection)
@@ -0,0 +1,105 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+
+def encode_cursor(sort_value: Any, doc_id: str) -> str:
+    """
+    Encodes a keyset position into an opaque cursor.
+
+    Args:
+        sort_value: Sort key of the last returned document; datetimes are stored as ISO strings
+        doc_id: ID of the last returned document
+
+    Returns:
+        str: URL-safe base64 encoded cursor
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, doc_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    """
+    Decodes an opaque cursor back into its keyset position.
+
+    Args:
+        cursor: Cursor previously produced by encode_cursor
+
+    Returns:
+        tuple[Any, str]: The raw (sort value, id) pair
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        sort_value, doc_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_value, str(doc_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def decode_datetime_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decodes a cursor whose sort key is a timestamp.
+
+    Args:
+        cursor: Cursor previously produced by encode_cursor
+
+    Returns:
+        tuple[datetime, str]: The (timestamp, id) pair
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    sort_value, doc_id = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(sort_value), doc_id
+    except TypeError as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_filter(field: str, sort_value: Any, doc_id: str, descending: bool = True) -> dict:
+    """
+    Builds the Mongo filter selecting documents after a keyset position.
+
+    Results must be sorted on (field, _id) in the same direction.
+
+    Args:
+        field: The sort field
+        sort_value: Sort key of the last returned document
+        doc_id: ID of the last returned document
+        descending: Whether the sort is descending
+
+    Returns:
+        dict: A filter matching every document past the position
+    """
+    operator = "$lt" if descending else "$gt"
+    return {"$or": [
+        {field: {operator: sort_value}},
+        {field: sort_value, "_id": {operator: doc_id}},
+    ]}
+
+
+def clamp_page_size(first: int | None, default: int, maximum: int) -> int:
+    """
+    Normalizes a requested page size.
+
+    Args:
+        first: Requested page size, None for the default
+        default: Page size used when none is requested
+        maximum: Upper bound for a single page
+
+    Returns:
+        int: A page size between 1 and maximum
+
+    Raises:
+        ValueError: If the requested size is not positive
+    """
+    if first is None:
+        return default
+    if first < 1:
+        raise ValueError("first must be a positive integer")
+    return min(first, maximum)
@@ -0,0 +1,184 @@
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Protocol
+
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+from app.core.database import MongoDB
+from app.core.metrics import RATE_LIMITED
+
+
+class RateLimitBackend(Protocol):
+    """
+    Storage of token buckets. Implementations must update a bucket atomically.
+    """
+    async def consume(self, key: str, capacity: float, refill_per_second: float) -> float:
+        """
+        Takes one token from a bucket.
+
+        Args:
+            key: The bucket key
+            capacity: Maximum number of tokens, which is also the allowed burst
+            refill_per_second: Tokens added back per second
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds until one is available
+        """
+        ...
+
+    async def peek(self, key: str, capacity: float, refill_per_second: float) -> float:
+        """
+        Checks a bucket without taking a token.
+
+        Args:
+            key: The bucket key
+            capacity: Maximum number of tokens, which is also the allowed burst
+            refill_per_second: Tokens added back per second
+
+        Returns:
+            float: 0 if a token is available, otherwise the seconds until one is
+        """
+        ...
+
+
+def _retry_after(tokens: float, refill_per_second: float) -> float:
+    return 0.0 if tokens >= 1 else (1 - tokens) / refill_per_second
+
+
+class MemoryRateLimitBackend:
+    """
+    Buckets kept in this worker only. The least recently used buckets are
+    dropped beyond maxsize, which can only make the limiter more lenient.
+    """
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def _tokens(self, key: str, capacity: float, refill_per_second: float, now: float) -> float:
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        return min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+    async def consume(self, key: str, capacity: float, refill_per_second: float) -> float:
+        now = time.monotonic()
+        tokens = self._tokens(key, capacity, refill_per_second, now)
+        retry_after = _retry_after(tokens, refill_per_second)
+        if not retry_after:
+            tokens -= 1
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+    async def peek(self, key: str, capacity: float, refill_per_second: float) -> float:
+        return _retry_after(self._tokens(key, capacity, refill_per_second, time.monotonic()), refill_per_second)
+
+
+class MongoRateLimitBackend:
+    """
+    Buckets shared by every worker, stored in the rate_limits collection.
+
+    Each check is a single find_one_and_update with an update pipeline, so
+    concurrent requests from different workers cannot both take the last token.
+    Idle buckets are removed by the TTL index on expires_at.
+    """
+    async def consume(self, key: str, capacity: float, refill_per_second: float) -> float:
+        now = time.time()
+        elapsed = {"$max": [0, {"$subtract": [now, {"$ifNull": ["$updated_at", now]}]}]}
+        refilled = {"$add": [{"$ifNull": ["$tokens", capacity]}, {"$multiply": [elapsed, refill_per_second]}]}
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=capacity / refill_per_second)
+        bucket = await MongoDB.get_db().rate_limits.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {"tokens": {"$min": [capacity, refilled]}, "updated_at": now, "expires_at": expires_at}},
+                {"$set": {"allowed": {"$gte": ["$tokens", 1]}}},
+                {"$set": {"tokens": {"$cond": ["$allowed", {"$subtract": ["$tokens", 1]}, "$tokens"]}}},
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        if bucket["allowed"]:
+            return 0.0
+        return _retry_after(bucket["tokens"], refill_per_second)
+
+    async def peek(self, key: str, capacity: float, refill_per_second: float) -> float:
+        bucket = await MongoDB.get_db().rate_limits.find_one({"_id": key}, {"tokens": 1, "updated_at": 1})
+        if bucket is None:
+            return 0.0
+        elapsed = max(0.0, time.time() - bucket["updated_at"])
+        return _retry_after(min(capacity, bucket["tokens"] + elapsed * refill_per_second), refill_per_second)
+
+
+def _create_backend() -> RateLimitBackend:
+    if settings.rate_limit_backend == "mongo":
+        return MongoRateLimitBackend()
+    return MemoryRateLimitBackend(settings.rate_limit_memory_keys)
+
+
+class AuthRateLimiter:
+    """
+    Admission control for the password endpoints, with one token bucket per
+    client IP and one per email address and client IP.
+
+    Every request takes a token from its IP bucket. The email bucket only
+    counts failed logins: it is checked before the password is verified and
+    charged when verification fails, so neither successful logins from many
+    devices nor requests from throttled clients drain it. It is also keyed on
+    the client IP, so failures from one address cannot lock the owner out
+    from another.
+    """
+    backend: RateLimitBackend = _create_backend()
+
+    @staticmethod
+    def _email_key(client_ip: str | None, email: str) -> str:
+        return f"email:{email.lower()}:{client_ip or ''}"
+
+    @classmethod
+    async def check(cls, client_ip: str | None, email: str | None) -> float:
+        """
+        Takes a token from the caller's IP bucket, then checks that its bucket for the email is not empty.
+
+        Args:
+            client_ip: The caller's address, if known
+            email: The email address whose failed logins from client_ip to check, if any
+
+        Returns:
+            float: 0 if the request may proceed, otherwise the seconds to wait before retrying
+        """
+        if not settings.rate_limit_enabled:
+            return 0.0
+
+        if client_ip:
+            retry_after = await cls.backend.consume(
+                f"ip:{client_ip}", settings.auth_ip_burst, settings.auth_ip_per_second
+            )
+            if retry_after:
+                RATE_LIMITED.inc(scope="ip")
+                return retry_after
+
+        if email:
+            retry_after = await cls.backend.peek(
+                cls._email_key(client_ip, email), settings.auth_email_burst, settings.auth_email_per_second
+            )
+            if retry_after:
+                RATE_LIMITED.inc(scope="email")
+                return retry_after
+
+        return 0.0
+
+    @classmethod
+    async def record_failure(cls, client_ip: str | None, email: str) -> None:
+        """
+        Takes a token from the caller's bucket for the email after a failed login.
+
+        Args:
+            client_ip: The caller's address, if known
+            email: The email address that failed to log in
+        """
+        if settings.rate_limit_enabled:
+            await cls.backend.consume(
+                cls._email_key(client_ip, email), settings.auth_email_burst, settings.auth_email_per_second
+            )
@@ -1,9 +1,22 @@
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 import jwt
 from pydantic import EmailStr
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.metrics import PASSWORD_HASH_LATENCY, PASSWORD_HASH_REJECTED, PASSWORD_HASH_WAIT, timed_call
+
+
+class HashingOverloadedError(RuntimeError):
+    """Raised when every password hashing slot is taken."""
+
 
 class Security:
     """
@@ -12,6 +25,10 @@ class Security:
     _pwd_context: CryptContext = CryptContext(
         schemes=["pbkdf2_sha256", "bcrypt"], default="pbkdf2_sha256",
                            pbkdf2_sha256__default_rounds=30000)
+    _hash_executor: Executor | None = None
+    # Hash operations running or queued in the pool.
+    _hash_pending: int = 0
+    token_cache: TTLCache = TTLCache(settings.token_cache_size, settings.token_cache_max_ttl_seconds)
 
     @classmethod
     def hash_password(cls, password: str) -> str:
@@ -41,7 +58,97 @@ class Security:
         return cls._pwd_context.verify(password, hashed)
 
     @classmethod
-    def create_access_token(cls, subject: EmailStr, is_admin: bool, expires_hours: int = 1) -> str:
+    def _get_hash_executor(cls) -> Executor:
+        """
+        Lazily creates the worker pool used for password hashing.
+
+        Returns:
+            Executor: A thread or process pool, depending on settings
+        """
+        if cls._hash_executor is None:
+            # By default hashing may use half the cores, leaving the rest to the API.
+            workers = settings.password_hash_workers or max(1, (os.cpu_count() or 2) // 2)
+            if settings.password_hash_executor == "process":
+                cls._hash_executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                cls._hash_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        return cls._hash_executor
+
+    @classmethod
+    async def _run_in_hash_pool(cls, func, *args):
+        """
+        Runs a hashing function in the worker pool, bounding the number of pending calls.
+
+        Calls beyond password_hash_max_pending are rejected at once rather than
+        queued, so a flood gets fast 429s instead of piling up waiting requests.
+
+        Args:
+            func: The blocking function to run
+            *args: Arguments for func
+
+        Returns:
+            The result of func
+
+        Raises:
+            HashingOverloadedError: If password_hash_max_pending operations are already pending
+        """
+        operation = func.__name__
+        if cls._hash_pending >= settings.password_hash_max_pending:
+            PASSWORD_HASH_REJECTED.inc(operation=operation)
+            raise HashingOverloadedError("Too many pending password hash operations")
+
+        started = time.perf_counter()
+        cls._hash_pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, duration = await loop.run_in_executor(cls._get_hash_executor(), timed_call, func, *args)
+        finally:
+            cls._hash_pending -= 1
+
+        PASSWORD_HASH_LATENCY.observe(duration, operation=operation)
+        PASSWORD_HASH_WAIT.observe(time.perf_counter() - started - duration, operation=operation)
+        return result
+
+    @classmethod
+    async def hash_password_async(cls, password: str) -> str:
+        """
+        Hashes a password in the worker pool, keeping the event loop free.
+
+        Args:
+            password: The plain text password
+
+        Returns:
+            str: The hashed password string
+        """
+        return await cls._run_in_hash_pool(cls.hash_password, password)
+
+    @classmethod
+    async def verify_password_async(cls, password: str, hashed: str) -> bool:
+        """
+        Verifies a password in the worker pool, keeping the event loop free.
+
+        Args:
+            password: The plain text password
+            hashed: The hashed password to verify against
+
+        Returns:
+            bool: True if password matches hash, False otherwise
+        """
+        return await cls._run_in_hash_pool(cls.verify_password, password, hashed)
+
+    @classmethod
+    async def shutdown_hash_executor(cls):
+        """
+        Stops the password hashing pool.
+        Should be called on app shutdown.
+        """
+        if cls._hash_executor is not None:
+            cls._hash_executor.shutdown(wait=False, cancel_futures=True)
+            cls._hash_executor = None
+
+    @classmethod
+    def create_access_token(cls, subject: EmailStr, is_admin: bool, expires_hours: int = 1,
+                            user_id: str | None = None) -> str:
         """
         Creates a JWT access token.
         
@@ -49,6 +156,7 @@ class Security:
             subject: The subject (email) for the token
             is_admin: Whether the user has admin privileges
             expires_hours: Token validity duration in hours
+            user_id: The ID of the user, stored in the uid claim
             
         Returns:
             str: Encoded JWT token string
@@ -57,7 +165,8 @@ class Security:
             "sub": subject,
             "is_admin": is_admin,
             "exp": datetime.now(timezone.utc) + timedelta(hours=expires_hours),
-            "iss": settings.jwt_app_id
+            "iss": settings.jwt_app_id,
+            "uid": user_id
         }
         return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
@@ -76,4 +185,32 @@ class Security:
             payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
             return payload
         except jwt.PyJWTError:
-            return None
\ No newline at end of file
+            return None
+
+    @classmethod
+    def verify_token_cached(cls, token: str) -> dict | None:
+        """
+        Verifies a JWT token, reusing the payload of an earlier successful verification.
+
+        Payloads are cached under the token's sha256 until the token expires,
+        capped by token_cache_max_ttl_seconds. Invalid tokens are never cached.
+        
+        Args:
+            token: The JWT token string
+            
+        Returns:
+            dict | None: The decoded payload if valid, None otherwise
+        """
+        key = hashlib.sha256(token.encode()).hexdigest()
+        payload = cls.token_cache.get(key)
+        if payload is not None:
+            return payload
+
+        payload = cls.verify_token(token)
+        if payload is None:
+            return None
+
+        ttl = min(payload.get("exp", 0) - time.time(), settings.token_cache_max_ttl_seconds)
+        if ttl > 0:
+            cls.token_cache.set(key, payload, ttl)
+        return payload
@@ -0,0 +1,145 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Turns query arguments built from dicts and lists into a hashable key.
+
+    Args:
+        value: A query, projection or plain value
+
+    Returns:
+        Hashable: An equivalent value made of tuples
+    """
+    if isinstance(value, dict):
+        return tuple((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical reads within this worker.
+
+    The first caller of a key starts the call; callers arriving while it is
+    in flight await the same result instead of issuing their own. Nothing is
+    kept once the call finishes, so this flattens bursts on cold keys without
+    serving stale data. The call runs as its own task, so a caller being
+    cancelled does not cancel it for the others. A disabled group runs
+    every call directly.
+    """
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.calls = 0
+        self.shared = 0
+        self._flights: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs func, or joins the call already in flight for key.
+
+        Args:
+            key: Identifies equivalent calls
+            func: Coroutine function making the call
+
+        Returns:
+            Any: The result of the call, shared by every caller of key
+        """
+        if not self.enabled:
+            return await func()
+
+        future = self._flights.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._track(key, future)
+            self.calls += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(future)
+
+    async def do_many(
+            self, keys: Iterable[Hashable], func: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]]
+    ) -> dict[Hashable, Any]:
+        """
+        Batch variant of do. Keys already in flight are joined; the rest are fetched with one call to func.
+
+        Args:
+            keys: The keys to resolve
+            func: Coroutine function fetching a list of keys and returning their results by key,
+                leaving out keys without a result
+
+        Returns:
+            dict[Hashable, Any]: Every requested key mapped to its result, None where func returned none
+        """
+        keys = list(dict.fromkeys(keys))
+        if not self.enabled:
+            results = await func(keys) if keys else {}
+            return {key: results.get(key) for key in keys}
+
+        futures: dict[Hashable, asyncio.Future] = {}
+        missing = []
+        for key in keys:
+            future = self._flights.get(key)
+            if future is None:
+                missing.append(key)
+            else:
+                futures[key] = future
+                self.shared += 1
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            pending = {key: loop.create_future() for key in missing}
+            for key, future in pending.items():
+                self._track(key, future)
+            futures.update(pending)
+            asyncio.ensure_future(func(missing)).add_done_callback(lambda task: self._settle(task, pending))
+            self.calls += 1
+
+        results = await asyncio.gather(*(asyncio.shield(future) for future in futures.values()))
+        return dict(zip(futures, results))
+
+    def forget(self) -> None:
+        """
+        Stops new callers from joining the calls in flight.
+
+        Call after a write, so reads issued before it are not shared with
+        callers arriving after it. Calls in flight still complete for the
+        callers already waiting on them.
+        """
+        self._flights.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the group's counters.
+
+        Returns:
+            dict[str, int]: Calls started, callers that joined one, and calls in flight
+        """
+        return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._flights)}
+
+    def _track(self, key: Hashable, future: asyncio.Future) -> None:
+        self._flights[key] = future
+
+        def done(finished: asyncio.Future) -> None:
+            if self._flights.get(key) is finished:
+                del self._flights[key]
+            if not finished.cancelled():
+                # Marks the exception as retrieved when every caller has gone away.
+                finished.exception()
+
+        future.add_done_callback(done)
+
+    @staticmethod
+    def _settle(task: asyncio.Future, pending: dict[Hashable, asyncio.Future]) -> None:
+        for key, future in pending.items():
+            if future.done():
+                continue
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result().get(key))
@@ -1,6 +1,6 @@
 import strawberry
 from fastapi.responses import JSONResponse
-from app.graphql.type import GameType
+from app.graphql.type import BulkItemResult, GameConnection, GameType
 
 
 def success_response(message: str, status_code: int = 400, data: dict = None) -> JSONResponse:
@@ -21,20 +21,22 @@ def success_response(message: str, status_code: int = 400, data: dict = None) ->
     )
 
 
-def error_response(message: str, status_code: int = 400) -> JSONResponse:
+def error_response(message: str, status_code: int = 400, headers: dict[str, str] | None = None) -> JSONResponse:
     """
     Constructs a uniform JSON error response.
     
     Args:
         message: Error message
         status_code: HTTP status code
+        headers: Optional extra response headers
         
     Returns:
         JSONResponse: Formatted JSON response
     """
     return JSONResponse(
         status_code=status_code,
-        content={"success": False, "message": message}
+        content={"success": False, "message": message},
+        headers=headers
     )
 
 
@@ -45,6 +47,20 @@ class SuccessResponse:
     code: int = 200
     data: list[GameType]  | None = None
 
+@strawberry.type
+class ConnectionResponse:
+    success: bool = True
+    message: str = "Success"
+    code: int = 200
+    data: GameConnection | None = None
+
+@strawberry.type
+class BulkResponse:
+    success: bool = True
+    message: str = "Success"
+    code: int = 200
+    data: list[BulkItemResult] = strawberry.field(default_factory=list)
+
 @strawberry.type
 class ErrorResponse:
     message: str = "An error occurred"
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class GameEventType(str, Enum):
+    created = "created"
+    updated = "updated"
+    deleted = "deleted"
+    liked = "liked"
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class GameSortField(str, Enum):
+    created_at = "created_at"
+    like_count = "like_count"
+
+
+class SortDirection(str, Enum):
+    asc = "asc"
+    desc = "desc"
@@ -0,0 +1,5 @@
+from enum import Enum
+
+
+class InvalidationScope(str, Enum):
+    games = "games"
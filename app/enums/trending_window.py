@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class TrendingWindow(str, Enum):
+    day = "day"
+    week = "week"
+    month = "month"
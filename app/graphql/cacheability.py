@@ -0,0 +1,48 @@
+from inspect import isawaitable
+from typing import Any
+
+from graphql import GraphQLResolveInfo
+from strawberry.extensions import SchemaExtension
+
+from app.core.etag import mark_uncacheable
+from app.core.util import ErrorResponse
+
+
+class UncacheableErrors(SchemaExtension):
+    """
+    Keeps failed operations from being tagged by CatalogETagMiddleware.
+
+    An operation is marked uncacheable when it ends with GraphQL errors or a
+    top-level resolver returns an ErrorResponse, so clients never get a 304
+    that pins them to an error.
+    """
+    def get_results(self) -> dict[str, Any]:
+        # Runs last on every path, including errors raised by other extensions.
+        if self.execution_context.pre_execution_errors:
+            self._mark(self.execution_context.context)
+        return {}
+
+    def resolve(self, _next, root, info: GraphQLResolveInfo, *args, **kwargs) -> Any:
+        result = _next(root, info, *args, **kwargs)
+        if info.path.prev is not None:
+            return result
+        if isawaitable(result):
+            return self._await(result, info)
+        self._check(result, info)
+        return result
+
+    async def _await(self, result, info: GraphQLResolveInfo) -> Any:
+        value = await result
+        self._check(value, info)
+        return value
+
+    def _check(self, value: Any, info: GraphQLResolveInfo) -> None:
+        # The resolve hook may be shared between executions, so the request comes from info.
+        if isinstance(value, ErrorResponse):
+            self._mark(info.context)
+
+    @staticmethod
+    def _mark(context: Any) -> None:
+        request = getattr(context, "request", None)
+        if request is not None:
+            mark_uncacheable(request)
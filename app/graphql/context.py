@@ -1,17 +1,54 @@
+from functools import cached_property
+
+from strawberry.dataloader import DataLoader
 from strawberry.fastapi import BaseContext
-from fastapi import Request
+from starlette.requests import HTTPConnection
+from starlette.websockets import WebSocket
 from app.services.graphql_service.gql_game_service import GqlGameService
+from app.services.graphql_service.gql_like_service import GqlLikeService
 from app.core.security import Security
 
 class GraphQLContext(BaseContext):
     """
     Context for GraphQL operations, holding request, user, and service instances.
     """
-    def __init__(self, request: Request):
+    def __init__(self, request: HTTPConnection):
         super().__init__()
         self.request = request
-        self.gql_game_service = GqlGameService()
-        self.user = self.get_current_user()
+        self.gql_like_service = GqlLikeService()
+        self._user: dict | None = None
+        self._user_resolved = False
+
+    @cached_property
+    def gql_game_service(self) -> GqlGameService:
+        """
+        The game service, created on first use.
+
+        Deferred because read routing depends on the user, and websocket
+        connections only authenticate in connection_init, after the context is built.
+        """
+        return GqlGameService(self.gql_like_service, self.user_id)
+
+    @cached_property
+    def game_loader(self) -> DataLoader:
+        """
+        Per-request DataLoader batching game lookups by ID.
+
+        A websocket context lives as long as the connection, so there the
+        loader only batches and leaves caching to the game cache, which is
+        invalidated on writes.
+        """
+        return DataLoader(
+            load_fn=self.gql_game_service.load_games, cache=not isinstance(self.request, WebSocket)
+        )
+
+    @property
+    def user(self) -> dict | None:
+        """The verified token payload, resolved on first access."""
+        if not self._user_resolved:
+            self._user = self.get_current_user()
+            self._user_resolved = True
+        return self._user
 
     def get_current_user(self):
         """
@@ -21,6 +58,9 @@ class GraphQLContext(BaseContext):
             dict | None: The user payload if authenticated, None otherwise
         """
         authorization = self.request.headers.get("Authorization")
+        if not authorization and isinstance(self.connection_params, dict):
+            # Browsers cannot set headers on websockets; subscriptions send the token in connection_init.
+            authorization = self.connection_params.get("Authorization") or self.connection_params.get("authorization")
         if not authorization:
             return None
         
@@ -29,7 +69,7 @@ class GraphQLContext(BaseContext):
             if scheme.lower() != "bearer":
                 return None
             
-            payload = Security.verify_token(token)
+            payload = Security.verify_token_cached(token)
             return payload
         except (ValueError, Exception):
             return None
@@ -39,7 +79,26 @@ class GraphQLContext(BaseContext):
         """Checks if the context has an authenticated user."""
         return self.user is not None
 
+    @property
+    def user_id(self) -> str | None:
+        """Returns the ID of the authenticated user, if the token carries one."""
+        return self.user.get("uid") if self.user else None
+
     @property
     def is_admin(self) -> bool:
         """Checks if the authenticated user has admin privileges."""
-        return self.user and self.user.get("is_admin", False)
\ No newline at end of file
+        return self.user and self.user.get("is_admin", False)
+
+    async def liked_game_ids(self, game_ids: list[str]) -> set[str]:
+        """
+        Returns which of the given games the current user has liked.
+
+        Args:
+            game_ids: The IDs of the games to check
+
+        Returns:
+            set[str]: The liked subset, empty for anonymous users
+        """
+        if self.user_id is None:
+            return set()
+        return await self.gql_like_service.liked_game_ids(self.user_id, game_ids)
@@ -18,3 +18,12 @@ class UnauthorizedError(StrawberryException):
         self.message = message
 
 
+class VersionConflictError(StrawberryException):
+    def exception_source(self):
+        pass
+
+    def __init__(self, game_id: str, expected_version: int, current_version: int):
+        self.current_version = current_version
+        self.message = (
+            f"Game with id {game_id} is at version {current_version}, expected version {expected_version}"
+        )
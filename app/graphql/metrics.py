@@ -0,0 +1,52 @@
+import time
+from inspect import isawaitable
+from typing import Any
+
+from graphql import GraphQLResolveInfo
+from strawberry.extensions import SchemaExtension
+
+from app.core.metrics import RESOLVER_ERRORS, RESOLVER_LATENCY
+from app.core.util import ErrorResponse
+
+
+class ResolverMetrics(SchemaExtension):
+    """
+    Records latency and errors of top-level query and mutation fields.
+
+    Resolvers report failures as ErrorResponse values rather than raising, so
+    both raised exceptions and returned ErrorResponses count as errors. Nested
+    fields are passed through untouched to keep the overhead per request constant.
+    """
+    def resolve(self, _next, root, info: GraphQLResolveInfo, *args, **kwargs) -> Any:
+        if info.path.prev is not None:
+            return _next(root, info, *args, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            self._record(info, started, None, failed=True)
+            raise
+
+        if isawaitable(result):
+            return self._await(result, info, started)
+        self._record(info, started, result)
+        return result
+
+    async def _await(self, result, info: GraphQLResolveInfo, started: float) -> Any:
+        try:
+            value = await result
+        except Exception:
+            self._record(info, started, None, failed=True)
+            raise
+        self._record(info, started, value)
+        return value
+
+    @staticmethod
+    def _record(info: GraphQLResolveInfo, started: float, value: Any, failed: bool = False) -> None:
+        labels = {"operation": info.operation.operation.value, "field": info.field_name}
+        RESOLVER_LATENCY.observe(time.perf_counter() - started, **labels)
+        if failed:
+            RESOLVER_ERRORS.inc(code="exception", **labels)
+        elif isinstance(value, ErrorResponse):
+            RESOLVER_ERRORS.inc(code=str(value.code), **labels)
@@ -1,12 +1,50 @@
 import strawberry
+from pydantic import ValidationError
 from strawberry import Info
 
-from app.core.util import ErrorResponse, SuccessResponse
+from app.core.config import settings
+from app.core.util import BulkResponse, ErrorResponse, SuccessResponse
 from app.graphql.context import GraphQLContext
-from app.graphql.exceptions import GameNotFoundError, UnauthorizedError
-from app.graphql.type import GameType, GameInput
-from app.models.game import Game
+from app.graphql.exceptions import GameNotFoundError, UnauthorizedError, VersionConflictError
+from app.graphql.projection import game_projection
+from app.graphql.type import BulkItemResult, GameType, GameInput, GameUpdate, GameUpdateInput
+from app.models.game import Game, GameChanges
 from app.core.logger import logger
+from app.enums.game_event_type import GameEventType
+from app.services.graphql_service.game_events import publish_game_event
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Flattens a pydantic ValidationError into a single line."""
+    return "; ".join(
+        f"{'.'.join(map(str, item['loc']))}: {item['msg']}" if item["loc"] else item["msg"] for item in error.errors()
+    )
+
+
+def _bulk_response(ids: list[str | None], errors: dict[int, str]) -> BulkResponse:
+    """
+    Builds the per-item result of a bulk mutation.
+
+    Args:
+        ids: The game ID of each item, in request order
+        errors: Error messages keyed by item position
+
+    Returns:
+        BulkResponse: One result per item
+    """
+    results = [
+        BulkItemResult(index=index, id=game_id, success=index not in errors, message=errors.get(index))
+        for index, game_id in enumerate(ids)
+    ]
+    message = "Success" if not errors else f"{len(errors)} of {len(ids)} items failed"
+    return BulkResponse(success=not errors, message=message, data=results)
+
+
+def _publish_bulk(event_type: GameEventType, ids: list[str | None], errors: dict[int, str]) -> None:
+    """Publishes an event for every item of a bulk mutation that succeeded."""
+    for index, game_id in enumerate(ids):
+        if game_id is not None and index not in errors:
+            publish_game_event(event_type, game_id)
 
 
 @strawberry.type
@@ -34,6 +72,7 @@ class Mutation:
 
             game = Game.create(**game_input.__dict__)
             created_game = await ctx.gql_game_service.create_game(game)
+            publish_game_event(GameEventType.created, created_game.id)
             return SuccessResponse(data=[GameType(**created_game.model_dump())])
 
         except UnauthorizedError as e:
@@ -44,14 +83,17 @@ class Mutation:
             return ErrorResponse()
 
     @strawberry.mutation
-    async def update_game(self, game_id: str, game_input: GameInput, info: Info) -> SuccessResponse | ErrorResponse:
+    async def update_game(
+            self, game_id: str, game_input: GameUpdateInput, info: Info, expected_version: int | None = None
+    ) -> SuccessResponse | ErrorResponse:
         """
-        Updates an existing game.
+        Updates the given fields of an existing game.
         
         Args:
             game_id: The ID of the game to update
-            game_input: The new data for the game
+            game_input: The fields to change; omitted fields are left as they are
             info: GraphQL execution info
+            expected_version: The game version the client last read; the update fails if it changed since
             
         Returns:
             SuccessResponse | ErrorResponse: The updated game or error details
@@ -61,28 +103,46 @@ class Mutation:
             if not ctx.is_admin:
                 raise UnauthorizedError("Unauthorized attempt to update game")
 
-            game = await ctx.gql_game_service.get_game_by_id(game_id)
-            if game is None:
-                raise GameNotFoundError(game_id)
+            fields = game_input.set_fields()
+            if not fields:
+                raise ValueError("No fields to update")
+            changes = GameChanges(**fields)
 
-            updated_game = await ctx.gql_game_service.update_game(game_id, game_input.__dict__)
-            return SuccessResponse(data=[GameType(**updated_game.model_dump())])
+            updated_game = await ctx.gql_game_service.update_game(
+                game_id, changes, expected_version, game_projection(info, "data")
+            )
+            if updated_game is None:
+                raise GameNotFoundError(game_id)
+            publish_game_event(GameEventType.updated, game_id)
+            return SuccessResponse(data=[updated_game])
 
         except (UnauthorizedError, GameNotFoundError) as e:
             logger.warning(f"Error updating game {game_id}: {e}")
             return ErrorResponse(success=False, message=str(e), code=401)
+        except VersionConflictError as e:
+            logger.warning(f"Conflicting update of game {game_id}: {e}")
+            return ErrorResponse(success=False, message=str(e), code=409)
+        except ValidationError as e:
+            logger.warning(f"Invalid update of game {game_id}: {e}")
+            return ErrorResponse(success=False, message=_validation_message(e), code=400)
+        except ValueError as e:
+            logger.warning(f"Invalid update of game {game_id}: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
         except Exception as e:
             logger.error(f"Unexpected error during game update {game_id}: {e}", exc_info=True)
             return ErrorResponse()
 
     @strawberry.mutation
-    async def delete_game(self, game_id: str, info: Info) -> SuccessResponse | ErrorResponse:
+    async def delete_game(
+            self, game_id: str, info: Info, expected_version: int | None = None
+    ) -> SuccessResponse | ErrorResponse:
         """
         Deletes a game.
         
         Args:
             game_id: The ID of the game to delete
             info: GraphQL execution info
+            expected_version: The game version the client last read; the deletion fails if it changed since
             
         Returns:
             SuccessResponse | ErrorResponse: The deleted game data or error details
@@ -92,55 +152,187 @@ class Mutation:
             if not ctx.is_admin:
                 raise UnauthorizedError("Unauthorized attempt to delete game")
 
-            game = await ctx.gql_game_service.get_game_by_id(game_id)
+            game = await ctx.gql_game_service.delete_game(game_id, expected_version, game_projection(info, "data"))
             if game is None:
                 raise GameNotFoundError(game_id)
-
-            await ctx.gql_game_service.delete_game(game_id)
-            return SuccessResponse(data=[GameType(**game.model_dump())])
+            publish_game_event(GameEventType.deleted, game_id)
+            return SuccessResponse(data=[game])
 
         except (UnauthorizedError, GameNotFoundError) as e:
             logger.warning(f"Error deleting game {game_id}: {e}")
             return ErrorResponse(success=False, message=str(e), code=401)
+        except VersionConflictError as e:
+            logger.warning(f"Conflicting deletion of game {game_id}: {e}")
+            return ErrorResponse(success=False, message=str(e), code=409)
         except Exception as e:
             logger.error(f"Unexpected error during game deletion {game_id}: {e}", exc_info=True)
             return ErrorResponse()
 
     @strawberry.mutation
-    async def toggle_like_game(self, game_id: str, user_id: str, info: Info) -> SuccessResponse | ErrorResponse:
+    async def toggle_like_game(
+            self, game_id: str, info: Info, user_id: str | None = None
+    ) -> SuccessResponse | ErrorResponse:
         """
-        Toggles the 'like' status of a game for a user.
+        Toggles the current user's 'like' on a game.
         
         Args:
             game_id: The ID of the game
-            user_id: The ID of the user liking the game
             info: GraphQL execution info
+            user_id: Deprecated; if given, must be the ID of the authenticated user
             
         Returns:
             SuccessResponse | ErrorResponse: The updated game state or error details
         """
         ctx: GraphQLContext = info.context
         try:
-            if not ctx.is_authenticated:
+            if ctx.user_id is None:
                 raise UnauthorizedError("Unauthorized attempt to toggle like game")
+            if user_id is not None and user_id != ctx.user_id:
+                raise UnauthorizedError("Unauthorized attempt to toggle like game for another user")
 
-            game = await ctx.gql_game_service.get_game_by_id(game_id)
-            if game is None:
+            projection = game_projection(info, "data")
+            projection["like_count"] = 1
+            toggled_game, liked = await ctx.gql_game_service.toggle_like_game(game_id, ctx.user_id, projection)
+            if toggled_game is None:
                 raise GameNotFoundError(game_id)
+            publish_game_event(GameEventType.liked, game_id, toggled_game.like_count)
 
-            user_str = str(user_id)
-            likes: list[str] = game.__dict__.get("likes", [])
-            if user_str in likes:
-                likes.remove(user_str)
-            else:
-                likes.append(user_str)
-
-            toggled_game = await ctx.gql_game_service.toggle_like_game(game_id, likes)
-            return SuccessResponse(data=[GameType(**toggled_game.model_dump())])
+            toggled_game.liked_by_me = liked
+            return SuccessResponse(data=[toggled_game])
 
         except (UnauthorizedError, GameNotFoundError) as e:
-            logger.warning(f"Error toggling like for game {game_id} by user {user_id}: {e}")
+            logger.warning(f"Error toggling like for game {game_id} by user {ctx.user_id}: {e}")
+            return ErrorResponse(success=False, message=str(e), code=401)
+        except Exception as e:
+            logger.error(f"Unexpected error toggling like for game {game_id} by user {ctx.user_id}: {e}", exc_info=True)
+            return ErrorResponse()
+
+    @strawberry.mutation
+    async def create_games(self, game_inputs: list[GameInput], info: Info) -> BulkResponse | ErrorResponse:
+        """
+        Creates many games in chunked insert_many calls.
+        
+        Args:
+            game_inputs: The input data for the new games
+            info: GraphQL execution info
+            
+        Returns:
+            BulkResponse | ErrorResponse: Per-item results or error details
+        """
+        ctx: GraphQLContext = info.context
+        try:
+            if not ctx.is_admin:
+                raise UnauthorizedError("Unauthorized attempt to create games")
+            if len(game_inputs) > settings.bulk_max_items:
+                raise ValueError(f"At most {settings.bulk_max_items} games can be created at once")
+
+            ids: list[str | None] = [None] * len(game_inputs)
+            errors: dict[int, str] = {}
+            games: list[Game] = []
+            positions: list[int] = []
+            for index, game_input in enumerate(game_inputs):
+                try:
+                    game = Game.create(**game_input.__dict__)
+                except ValidationError as e:
+                    errors[index] = _validation_message(e)
+                    continue
+                ids[index] = game.id
+                games.append(game)
+                positions.append(index)
+
+            write_errors = await ctx.gql_game_service.create_games(games)
+            errors.update({positions[position]: message for position, message in write_errors.items()})
+            _publish_bulk(GameEventType.created, ids, errors)
+            return _bulk_response(ids, errors)
+
+        except UnauthorizedError as e:
+            logger.warning(f"Unauthorized attempt to create games: {e}")
+            return ErrorResponse(success=False, message=str(e), code=401)
+        except ValueError as e:
+            logger.warning(f"Invalid bulk game creation: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
+        except Exception as e:
+            logger.error(f"Unexpected error during bulk game creation: {e}", exc_info=True)
+            return ErrorResponse()
+
+    @strawberry.mutation
+    async def update_games(self, updates: list[GameUpdate], info: Info) -> BulkResponse | ErrorResponse:
+        """
+        Updates many games in chunked bulk_write calls.
+        
+        Args:
+            updates: The games to update and the fields to change; omitted fields are left as they are
+            info: GraphQL execution info
+            
+        Returns:
+            BulkResponse | ErrorResponse: Per-item results or error details
+        """
+        ctx: GraphQLContext = info.context
+        try:
+            if not ctx.is_admin:
+                raise UnauthorizedError("Unauthorized attempt to update games")
+            if len(updates) > settings.bulk_max_items:
+                raise ValueError(f"At most {settings.bulk_max_items} games can be updated at once")
+
+            errors: dict[int, str] = {}
+            changes: list[tuple[str, GameChanges]] = []
+            positions: list[int] = []
+            for index, update in enumerate(updates):
+                fields = update.game_input.set_fields()
+                if not fields:
+                    errors[index] = "No fields to update"
+                    continue
+                try:
+                    changes.append((update.game_id, GameChanges(**fields)))
+                except ValidationError as e:
+                    errors[index] = _validation_message(e)
+                    continue
+                positions.append(index)
+
+            write_errors = await ctx.gql_game_service.update_games(changes)
+            errors.update({positions[position]: message for position, message in write_errors.items()})
+            _publish_bulk(GameEventType.updated, [update.game_id for update in updates], errors)
+            return _bulk_response([update.game_id for update in updates], errors)
+
+        except UnauthorizedError as e:
+            logger.warning(f"Unauthorized attempt to update games: {e}")
+            return ErrorResponse(success=False, message=str(e), code=401)
+        except ValueError as e:
+            logger.warning(f"Invalid bulk game update: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
+        except Exception as e:
+            logger.error(f"Unexpected error during bulk game update: {e}", exc_info=True)
+            return ErrorResponse()
+
+    @strawberry.mutation
+    async def delete_games(self, game_ids: list[str], info: Info) -> BulkResponse | ErrorResponse:
+        """
+        Deletes many games, and their likes, in chunks.
+        
+        Args:
+            game_ids: The IDs of the games to delete
+            info: GraphQL execution info
+            
+        Returns:
+            BulkResponse | ErrorResponse: Per-item results or error details
+        """
+        ctx: GraphQLContext = info.context
+        try:
+            if not ctx.is_admin:
+                raise UnauthorizedError("Unauthorized attempt to delete games")
+            if len(game_ids) > settings.bulk_max_items:
+                raise ValueError(f"At most {settings.bulk_max_items} games can be deleted at once")
+
+            errors = await ctx.gql_game_service.delete_games(game_ids)
+            _publish_bulk(GameEventType.deleted, game_ids, errors)
+            return _bulk_response(list(game_ids), errors)
+
+        except UnauthorizedError as e:
+            logger.warning(f"Unauthorized attempt to delete games: {e}")
             return ErrorResponse(success=False, message=str(e), code=401)
+        except ValueError as e:
+            logger.warning(f"Invalid bulk game deletion: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
         except Exception as e:
-            logger.error(f"Unexpected error toggling like for game {game_id} by user {user_id}: {e}", exc_info=True)
+            logger.error(f"Unexpected error during bulk game deletion: {e}", exc_info=True)
             return ErrorResponse()
@@ -0,0 +1,76 @@
+import hashlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from graphql import DocumentNode, GraphQLError
+from strawberry.extensions import SchemaExtension
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """
+    A query text together with its parsed and validated document.
+    """
+    query: str
+    document: DocumentNode
+
+
+class PersistedQueries(SchemaExtension):
+    """
+    Automatic persisted queries plus a parsed-document cache.
+
+    Clients following the Apollo APQ protocol send only
+    extensions.persistedQuery.sha256Hash; the query text is sent once, after
+    the server answers PersistedQueryNotFound. Every successfully validated
+    document, persisted or not, is kept keyed by its sha256 so repeated
+    operations skip parsing and validation.
+
+    Registered as a class so each execution gets its own instance; the cache
+    is shared through the class attribute.
+    """
+    documents: TTLCache = TTLCache(settings.persisted_query_cache_size, settings.persisted_query_ttl_seconds)
+
+    def __init__(self, *, execution_context=None):
+        super().__init__(execution_context=execution_context)
+        self.query_hash: str | None = None
+        self.cached: CachedDocument | None = None
+
+    def on_operation(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        persisted = (execution_context.operation_extensions or {}).get("persistedQuery")
+        query_hash = persisted.get("sha256Hash") if isinstance(persisted, dict) else None
+
+        if query_hash and execution_context.query is None:
+            self.cached = self.documents.get(query_hash)
+            if self.cached is None:
+                raise GraphQLError("PersistedQueryNotFound", extensions={"code": "PERSISTED_QUERY_NOT_FOUND"})
+            execution_context.query = self.cached.query
+        elif execution_context.query is not None:
+            computed_hash = hashlib.sha256(execution_context.query.encode()).hexdigest()
+            if query_hash and query_hash != computed_hash:
+                raise GraphQLError("provided sha does not match query", extensions={"code": "BAD_REQUEST"})
+            query_hash = computed_hash
+            self.cached = self.documents.get(query_hash)
+
+        self.query_hash = query_hash
+        yield
+
+    def on_parse(self) -> Iterator[None]:
+        if self.cached is not None:
+            self.execution_context.graphql_document = self.cached.document
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        if self.cached is not None:
+            # Only documents that passed validation are cached.
+            execution_context.pre_execution_errors = []
+        yield
+
+        if self.cached is None and self.query_hash and not execution_context.pre_execution_errors:
+            self.documents.set(
+                self.query_hash, CachedDocument(execution_context.query, execution_context.graphql_document)
+            )
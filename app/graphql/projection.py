@@ -0,0 +1,62 @@
+from strawberry import Info
+from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField, Selection
+from strawberry.utils.str_converters import to_snake_case
+
+from app.models.game import Game
+
+# Fetched whatever the selection, as the default pagination sort key.
+GAME_BASE_FIELDS = frozenset({"created_at"})
+
+
+def _collect_fields(selections: list[Selection], path: tuple[str, ...], fields: set[str]) -> None:
+    """
+    Collects the field names selected at the end of path, following fragments.
+
+    Args:
+        selections: The selections to walk
+        path: Remaining GraphQL field names leading to the game object
+        fields: Accumulator for the selected field names
+    """
+    for selection in selections:
+        if isinstance(selection, (InlineFragment, FragmentSpread)):
+            _collect_fields(selection.selections, path, fields)
+        elif isinstance(selection, SelectedField):
+            if not path:
+                fields.add(selection.name)
+            elif selection.name == path[0]:
+                _collect_fields(selection.selections, path[1:], fields)
+
+
+def selected_game_fields(info: Info, *path: str) -> set[str]:
+    """
+    Returns the game fields a query selected, as Python field names.
+
+    Args:
+        info: GraphQL execution info of the resolver
+        *path: GraphQL field names from the resolver's result down to the game object
+
+    Returns:
+        set[str]: Snake-cased names of the selected fields
+    """
+    selected: set[str] = set()
+    for field in info.selected_fields:
+        _collect_fields(field.selections, path, selected)
+
+    return {to_snake_case(name) for name in selected}
+
+
+def game_projection(info: Info, *path: str) -> dict[str, int]:
+    """
+    Builds a Mongo projection from the game fields a query selected.
+
+    Args:
+        info: GraphQL execution info of the resolver
+        *path: GraphQL field names from the resolver's result down to the game object
+
+    Returns:
+        dict[str, int]: Inclusion projection for the games collection
+    """
+    fields = set(GAME_BASE_FIELDS)
+    fields.update(name for name in selected_game_fields(info, *path) if name in Game.model_fields)
+    fields.discard("id")
+    return {field_name: 1 for field_name in sorted(fields)}
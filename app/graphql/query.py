@@ -1,10 +1,39 @@
+from typing import Annotated
+
 import strawberry
 from strawberry import Info
+from app.core.config import settings
 from app.core.logger import logger
-from app.core.util import ErrorResponse, SuccessResponse
+from app.core.pagination import clamp_page_size, encode_cursor
+from app.core.util import ConnectionResponse, ErrorResponse, SuccessResponse
 from app.graphql.context import GraphQLContext
-from app.graphql.type import GameType
+from app.graphql.type import GameConnection, GameEdge, GameFilter, GameSort, GameType, PageInfo
+from app.graphql.projection import game_projection, selected_game_fields
 from app.graphql.exceptions import UnauthorizedError, GameNotFoundError
+from app.enums.trending_window import TrendingWindow
+from app.services.graphql_service.game_lists import GameLists
+
+
+async def _listed_games(ctx: GraphQLContext, info: Info, game_ids: list[str]) -> list[GameType]:
+    """
+    Loads the games of a materialized list, in list order.
+
+    Args:
+        ctx: The GraphQL context
+        info: GraphQL execution info
+        game_ids: The IDs of the listed games
+
+    Returns:
+        list[GameType]: The games that still exist
+    """
+    games = [game for game in await ctx.game_loader.load_many(game_ids) if game is not None]
+    liked_ids = set()
+    if "liked_by_me" in selected_game_fields(info, "data"):
+        liked_ids = await ctx.liked_game_ids([game.id for game in games])
+
+    for game in games:
+        game.liked_by_me = game.id in liked_ids
+    return games
 
 
 @strawberry.type
@@ -30,11 +59,16 @@ class Query:
             if not ctx.is_authenticated:
                 raise UnauthorizedError("Unauthorized access attempt to view game")
 
-            game = await ctx.gql_game_service.get_game_by_id(game_id)
+            game = await ctx.game_loader.load(game_id)
             if not game:
                 raise GameNotFoundError(game_id)
 
-            return SuccessResponse(data=[GameType(**game.model_dump())])
+            liked_ids = set()
+            if "liked_by_me" in selected_game_fields(info, "data"):
+                liked_ids = await ctx.liked_game_ids([game.id])
+
+            game.liked_by_me = game.id in liked_ids
+            return SuccessResponse(data=[game])
 
         except (UnauthorizedError, GameNotFoundError) as e:
             logger.warning(f"Error fetching game {game_id}: {e}")
@@ -44,27 +78,272 @@ class Query:
             return ErrorResponse()
 
     @strawberry.field
-    async def games(self, info: Info) -> SuccessResponse | ErrorResponse:
+    async def games_by_ids(self, ids: list[str], info: Info) -> SuccessResponse | ErrorResponse:
         """
-        Retrieves a list of all games.
+        Retrieves several games by ID in a single database round trip.
         
         Args:
+            ids: The IDs of the games to retrieve
             info: GraphQL execution info
             
         Returns:
-            SuccessResponse | ErrorResponse: List of games or error details
+            SuccessResponse | ErrorResponse: The found games in request order or error details
         """
         ctx: GraphQLContext = info.context
         try:
             if not ctx.is_authenticated:
                 raise UnauthorizedError("Unauthorized access attempt to view games")
+            if len(ids) > settings.games_max_page_size:
+                raise ValueError(f"At most {settings.games_max_page_size} ids can be requested at once")
 
-            games = await ctx.gql_game_service.list_games()
-            return SuccessResponse(data=[GameType(**game.model_dump()) for game in games])
+            games = [game for game in await ctx.game_loader.load_many(ids) if game is not None]
+            liked_ids = set()
+            if "liked_by_me" in selected_game_fields(info, "data"):
+                liked_ids = await ctx.liked_game_ids([game.id for game in games])
+
+            for game in games:
+                game.liked_by_me = game.id in liked_ids
+            return SuccessResponse(data=games)
+
+        except UnauthorizedError as e:
+            logger.warning(f"Unauthorized access attempt to fetch games by ids: {e}")
+            return ErrorResponse(success=False, message=str(e), code=401)
+        except ValueError as e:
+            logger.warning(f"Invalid arguments for games by ids: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
+        except Exception as e:
+            logger.error(f"Unexpected error fetching games by ids: {e}", exc_info=True)
+            return ErrorResponse()
+
+    @strawberry.field
+    async def games(
+            self,
+            info: Info,
+            first: int | None = None,
+            after: str | None = None,
+            game_filter: Annotated[GameFilter | None, strawberry.argument(name="filter")] = None,
+            sort: GameSort | None = None,
+    ) -> ConnectionResponse | ErrorResponse:
+        """
+        Retrieves one page of games matching an optional filter, newest first by default.
+        
+        Args:
+            info: GraphQL execution info
+            first: Maximum number of games to return
+            after: Cursor of the last game of the previous page
+            game_filter: Equality filters on type, publisher name and featured flag
+            sort: Sort field and direction
+            
+        Returns:
+            ConnectionResponse | ErrorResponse: A page of games or error details
+        """
+        ctx: GraphQLContext = info.context
+        try:
+            if not ctx.is_authenticated:
+                raise UnauthorizedError("Unauthorized access attempt to view games")
+
+            page_size = clamp_page_size(first, settings.games_page_size, settings.games_max_page_size)
+            sort = sort or GameSort()
+            filters = {}
+            if game_filter is not None:
+                filters = {key: value for key, value in vars(game_filter).items() if value is not None}
+
+            projection = game_projection(info, "data", "edges", "node")
+            projection[sort.field.value] = 1
+            games, has_next_page = await ctx.gql_game_service.list_games(
+                page_size, after, projection, filters, sort.field, sort.direction
+            )
+            liked_ids = set()
+            if "liked_by_me" in selected_game_fields(info, "data", "edges", "node"):
+                liked_ids = await ctx.liked_game_ids([game.id for game in games])
+
+            edges = []
+            for game in games:
+                game.liked_by_me = game.id in liked_ids
+                edges.append(GameEdge(cursor=encode_cursor(getattr(game, sort.field.value), game.id), node=game))
+            page_info = PageInfo(
+                has_next_page=has_next_page,
+                end_cursor=edges[-1].cursor if edges else None,
+            )
+            return ConnectionResponse(data=GameConnection(edges=edges, page_info=page_info))
 
         except UnauthorizedError as e:
             logger.warning(f"Unauthorized access attempt to list games: {e}")
             return ErrorResponse(success=False, message=str(e), code=401)
+        except ValueError as e:
+            logger.warning(f"Invalid pagination arguments for games list: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
         except Exception as e:
             logger.error(f"Unexpected error fetching games list: {e}", exc_info=True)
             return ErrorResponse()
+
+    @strawberry.field
+    async def search_games(
+            self, query: str, info: Info, first: int | None = None, after: str | None = None
+    ) -> ConnectionResponse | ErrorResponse:
+        """
+        Retrieves one page of games matching a full-text query, most relevant first.
+
+        Matches on name, publisher name and description, in decreasing order of weight.
+        
+        Args:
+            query: The search terms; quoted phrases and -excluded terms are supported
+            info: GraphQL execution info
+            first: Maximum number of games to return
+            after: Cursor of the last game of the previous page
+            
+        Returns:
+            ConnectionResponse | ErrorResponse: A page of matching games or error details
+        """
+        ctx: GraphQLContext = info.context
+        try:
+            if not ctx.is_authenticated:
+                raise UnauthorizedError("Unauthorized access attempt to search games")
+
+            query = query.strip()
+            if not query:
+                raise ValueError("query must not be empty")
+            if len(query) > settings.search_max_query_length:
+                raise ValueError(f"query must be at most {settings.search_max_query_length} characters")
+
+            page_size = clamp_page_size(first, settings.games_page_size, settings.games_max_page_size)
+            projection = game_projection(info, "data", "edges", "node")
+            results, has_next_page = await ctx.gql_game_service.search_games(query, page_size, after, projection)
+            liked_ids = set()
+            if "liked_by_me" in selected_game_fields(info, "data", "edges", "node"):
+                liked_ids = await ctx.liked_game_ids([game.id for game, _ in results])
+
+            edges = []
+            for game, score in results:
+                game.liked_by_me = game.id in liked_ids
+                edges.append(GameEdge(cursor=encode_cursor(score, game.id), node=game))
+            page_info = PageInfo(
+                has_next_page=has_next_page,
+                end_cursor=edges[-1].cursor if edges else None,
+            )
+            return ConnectionResponse(data=GameConnection(edges=edges, page_info=page_info))
+
+        except UnauthorizedError as e:
+            logger.warning(f"Unauthorized access attempt to search games: {e}")
+            return ErrorResponse(success=False, message=str(e), code=401)
+        except ValueError as e:
+            logger.warning(f"Invalid search arguments: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
+        except Exception as e:
+            logger.error(f"Unexpected error searching games: {e}", exc_info=True)
+            return ErrorResponse()
+
+    @strawberry.field
+    async def liked_games(
+            self, info: Info, first: int | None = None, after: str | None = None
+    ) -> ConnectionResponse | ErrorResponse:
+        """
+        Retrieves one page of the games the current user liked, most recent like first.
+        
+        Args:
+            info: GraphQL execution info
+            first: Maximum number of games to return
+            after: Cursor of the last like of the previous page
+            
+        Returns:
+            ConnectionResponse | ErrorResponse: A page of liked games or error details
+        """
+        ctx: GraphQLContext = info.context
+        try:
+            if ctx.user_id is None:
+                raise UnauthorizedError("Unauthorized access attempt to view liked games")
+
+            page_size = clamp_page_size(first, settings.games_page_size, settings.games_max_page_size)
+            likes, has_next_page = await ctx.gql_like_service.list_liked(ctx.user_id, page_size, after)
+            projection = game_projection(info, "data", "edges", "node")
+            games = await ctx.gql_game_service.get_games_by_ids([like["game_id"] for like in likes], projection)
+
+            edges = []
+            for like in likes:
+                game = games.get(like["game_id"])
+                if game is not None:
+                    game.liked_by_me = True
+                    edges.append(GameEdge(cursor=encode_cursor(like["created_at"], like["_id"]), node=game))
+            page_info = PageInfo(
+                has_next_page=has_next_page,
+                end_cursor=encode_cursor(likes[-1]["created_at"], likes[-1]["_id"]) if likes else None,
+            )
+            return ConnectionResponse(data=GameConnection(edges=edges, page_info=page_info))
+
+        except UnauthorizedError as e:
+            logger.warning(f"Unauthorized access attempt to list liked games: {e}")
+            return ErrorResponse(success=False, message=str(e), code=401)
+        except ValueError as e:
+            logger.warning(f"Invalid pagination arguments for liked games list: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
+        except Exception as e:
+            logger.error(f"Unexpected error fetching liked games list: {e}", exc_info=True)
+            return ErrorResponse()
+
+    @strawberry.field
+    async def featured_games(self, info: Info, first: int | None = None) -> SuccessResponse | ErrorResponse:
+        """
+        Retrieves the featured games, most liked first, from the materialized featured list.
+        
+        Args:
+            info: GraphQL execution info
+            first: Maximum number of games to return
+            
+        Returns:
+            SuccessResponse | ErrorResponse: The featured games or error details
+        """
+        ctx: GraphQLContext = info.context
+        try:
+            if not ctx.is_authenticated:
+                raise UnauthorizedError("Unauthorized access attempt to view featured games")
+
+            count = clamp_page_size(first, settings.game_lists_size, settings.game_lists_size)
+            await GameLists.ensure_built()
+            games = await _listed_games(ctx, info, GameLists.featured.top(count))
+            # Games unfeatured by another worker stay listed until the next rebuild.
+            return SuccessResponse(data=[game for game in games if game.is_featured])
+
+        except UnauthorizedError as e:
+            logger.warning(f"Unauthorized access attempt to list featured games: {e}")
+            return ErrorResponse(success=False, message=str(e), code=401)
+        except ValueError as e:
+            logger.warning(f"Invalid arguments for featured games: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
+        except Exception as e:
+            logger.error(f"Unexpected error fetching featured games: {e}", exc_info=True)
+            return ErrorResponse()
+
+    @strawberry.field
+    async def trending_games(
+            self, info: Info, window: TrendingWindow = TrendingWindow.day, first: int | None = None
+    ) -> SuccessResponse | ErrorResponse:
+        """
+        Retrieves the games that received the most likes within a recent window,
+        from the materialized trending lists.
+        
+        Args:
+            info: GraphQL execution info
+            window: How far back likes are counted
+            first: Maximum number of games to return
+            
+        Returns:
+            SuccessResponse | ErrorResponse: The trending games or error details
+        """
+        ctx: GraphQLContext = info.context
+        try:
+            if not ctx.is_authenticated:
+                raise UnauthorizedError("Unauthorized access attempt to view trending games")
+
+            count = clamp_page_size(first, settings.game_lists_size, settings.game_lists_size)
+            await GameLists.ensure_built()
+            return SuccessResponse(data=await _listed_games(ctx, info, GameLists.trending[window].top(count)))
+
+        except UnauthorizedError as e:
+            logger.warning(f"Unauthorized access attempt to list trending games: {e}")
+            return ErrorResponse(success=False, message=str(e), code=401)
+        except ValueError as e:
+            logger.warning(f"Invalid arguments for trending games: {e}")
+            return ErrorResponse(success=False, message=str(e), code=400)
+        except Exception as e:
+            logger.error(f"Unexpected error fetching trending games: {e}", exc_info=True)
+            return ErrorResponse()
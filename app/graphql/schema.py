@@ -1,6 +1,14 @@
 import strawberry
 
+from app.core.config import settings
+from app.graphql.cacheability import UncacheableErrors
+from app.graphql.metrics import ResolverMetrics
 from app.graphql.mutation import Mutation
+from app.graphql.persisted_queries import PersistedQueries
 from app.graphql.query import Query
+from app.graphql.subscription import Subscription
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
\ No newline at end of file
+extensions = [UncacheableErrors, PersistedQueries]
+if settings.metrics_enabled:
+    extensions.append(ResolverMetrics)
+schema = strawberry.Schema(query=Query, mutation=Mutation, subscription=Subscription, extensions=extensions)
\ No newline at end of file
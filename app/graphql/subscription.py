@@ -0,0 +1,99 @@
+from collections.abc import AsyncGenerator
+
+import strawberry
+from strawberry import Info
+
+from app.core.logger import logger
+from app.enums.game_event_type import GameEventType
+from app.graphql.context import GraphQLContext
+from app.graphql.exceptions import UnauthorizedError
+from app.graphql.projection import game_projection, selected_game_fields
+from app.graphql.type import CatalogChange, GameLikeEvent, GameType
+from app.services.graphql_service.game_events import game_events
+
+
+def _require_authentication(ctx: GraphQLContext, subscription: str) -> None:
+    """
+    Rejects subscriptions from unauthenticated connections.
+
+    Args:
+        ctx: The connection's context
+        subscription: Name of the subscription, for the log
+
+    Raises:
+        UnauthorizedError: If the connection carries no valid token
+    """
+    if not ctx.is_authenticated:
+        logger.warning(f"Unauthorized attempt to subscribe to {subscription}")
+        raise UnauthorizedError(f"Unauthorized attempt to subscribe to {subscription}")
+
+
+@strawberry.type
+class Subscription:
+    """
+    Root subscription type, pushing game changes to websocket clients.
+    """
+
+    @strawberry.subscription
+    async def game_updated(self, info: Info, game_id: str | None = None) -> AsyncGenerator[GameType, None]:
+        """
+        Pushes the current state of a game whenever it is created, edited or liked.
+        
+        Args:
+            info: GraphQL execution info
+            game_id: Only report this game, all games if omitted
+            
+        Yields:
+            GameType: The game after the change
+        """
+        ctx: GraphQLContext = info.context
+        _require_authentication(ctx, "gameUpdated")
+        projection = game_projection(info)
+        with_liked_by_me = "liked_by_me" in selected_game_fields(info)
+
+        async for event in game_events.subscribe():
+            if event.type is GameEventType.deleted or (game_id is not None and event.game_id != game_id):
+                continue
+            game = await ctx.gql_game_service.get_game_by_id(event.game_id, projection)
+            if game is None:
+                continue
+            if with_liked_by_me:
+                game.liked_by_me = game.id in await ctx.liked_game_ids([game.id])
+            yield game
+
+    @strawberry.subscription
+    async def game_liked(self, info: Info, game_id: str | None = None) -> AsyncGenerator[GameLikeEvent, None]:
+        """
+        Pushes a game's new like count whenever someone likes or unlikes it.
+        
+        Args:
+            info: GraphQL execution info
+            game_id: Only report this game, all games if omitted
+            
+        Yields:
+            GameLikeEvent: The game ID and its like count
+        """
+        ctx: GraphQLContext = info.context
+        _require_authentication(ctx, "gameLiked")
+
+        async for event in game_events.subscribe():
+            if event.type is GameEventType.liked and (game_id is None or event.game_id == game_id):
+                yield GameLikeEvent(game_id=event.game_id, like_count=event.like_count)
+
+    @strawberry.subscription
+    async def catalog_changed(self, info: Info) -> AsyncGenerator[CatalogChange, None]:
+        """
+        Pushes every game creation, edit and deletion.
+        
+        Args:
+            info: GraphQL execution info
+            
+        Yields:
+            CatalogChange: What happened and to which game
+        """
+        ctx: GraphQLContext = info.context
+        _require_authentication(ctx, "catalogChanged")
+
+        async for event in game_events.subscribe():
+            if event.type is not GameEventType.liked:
+                yield CatalogChange(type=event.type, game_id=event.game_id)
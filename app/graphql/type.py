@@ -1,5 +1,14 @@
 import strawberry
 
+from app.enums.game_event_type import GameEventType
+from app.enums.game_sort import GameSortField, SortDirection
+from app.enums.trending_window import TrendingWindow
+
+strawberry.enum(GameSortField)
+strawberry.enum(SortDirection)
+strawberry.enum(GameEventType)
+strawberry.enum(TrendingWindow)
+
 
 @strawberry.type
 class GameType:
@@ -13,9 +22,42 @@ class GameType:
     cover_image_url: str
     created_at: str | None = None
     updated_at: str | None = None
-    likes: list[str] = strawberry.field(default_factory=list)
+    like_count: int = 0
+    liked_by_me: bool | None = None
     trailer: str | None = None
     collage: list[str] = strawberry.field(default_factory=list)
+    version: int = 1
+
+    @classmethod
+    def from_document(cls, doc: dict) -> "GameType":
+        """
+        Maps a stored game document straight to the GraphQL type.
+
+        Stored documents were validated on write, so reads skip the Game model.
+        Fields left out by a projection come back as None or their default.
+
+        Args:
+            doc: A document from the games collection
+
+        Returns:
+            GameType: The GraphQL representation of the game
+        """
+        return cls(
+            id=doc["_id"],
+            name=doc.get("name"),
+            type=doc.get("type"),
+            publisher_name=doc.get("publisher_name"),
+            external_game_id=doc.get("external_game_id"),
+            description=doc.get("description"),
+            is_featured=doc.get("is_featured", False),
+            cover_image_url=doc.get("cover_image_url"),
+            created_at=doc.get("created_at"),
+            updated_at=doc.get("updated_at"),
+            like_count=doc.get("like_count", 0),
+            trailer=doc.get("trailer"),
+            collage=doc.get("collage") or [],
+            version=doc.get("version", 1),
+        )
 
 @strawberry.input
 class GameInput:
@@ -27,5 +69,76 @@ class GameInput:
     is_featured: bool = False
     cover_image_url: str
     trailer: str | None = None
-    likes: list[str] = strawberry.field(default_factory=list)
-    collage: list[str] = strawberry.field(default_factory=list)
\ No newline at end of file
+    collage: list[str] = strawberry.field(default_factory=list)
+
+@strawberry.input
+class GameUpdateInput:
+    """
+    Partial update of a game. Omitted fields keep their stored value.
+    """
+    name: str | None = strawberry.UNSET
+    type: str | None = strawberry.UNSET
+    publisher_name: str | None = strawberry.UNSET
+    external_game_id: str | None = strawberry.UNSET
+    description: str | None = strawberry.UNSET
+    is_featured: bool | None = strawberry.UNSET
+    cover_image_url: str | None = strawberry.UNSET
+    trailer: str | None = strawberry.UNSET
+    collage: list[str] | None = strawberry.UNSET
+
+    def set_fields(self) -> dict:
+        """
+        Returns the fields the client sent, including explicit nulls.
+
+        Returns:
+            dict: Field values keyed by Python field name
+        """
+        return {key: value for key, value in self.__dict__.items() if value is not strawberry.UNSET}
+
+@strawberry.input
+class GameUpdate:
+    game_id: str
+    game_input: GameUpdateInput
+
+@strawberry.type
+class BulkItemResult:
+    index: int
+    id: str | None = None
+    success: bool = True
+    message: str | None = None
+
+@strawberry.type
+class PageInfo:
+    has_next_page: bool = False
+    end_cursor: str | None = None
+
+@strawberry.type
+class GameEdge:
+    cursor: str
+    node: GameType
+
+@strawberry.type
+class GameConnection:
+    edges: list[GameEdge] = strawberry.field(default_factory=list)
+    page_info: PageInfo = strawberry.field(default_factory=PageInfo)
+
+@strawberry.input
+class GameFilter:
+    type: str | None = None
+    publisher_name: str | None = None
+    is_featured: bool | None = None
+
+@strawberry.input
+class GameSort:
+    field: GameSortField = GameSortField.created_at
+    direction: SortDirection = SortDirection.desc
+
+@strawberry.type
+class GameLikeEvent:
+    game_id: str
+    like_count: int | None = None
+
+@strawberry.type
+class CatalogChange:
+    type: GameEventType
+    game_id: str
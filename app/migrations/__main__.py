@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+
+from app.core.database import MongoDB
+from app.core.indexes import ensure_indexes
+from app.migrations.runner import applied_versions, discover_migrations, migrate
+
+
+async def run(args: argparse.Namespace) -> None:
+    await MongoDB.connect()
+    try:
+        db = MongoDB.get_db()
+        if args.command == "upgrade":
+            await ensure_indexes(db)
+            applied = await migrate(db, args.target)
+            print(f"Applied {len(applied)} migration(s)")
+        elif args.command == "indexes":
+            await ensure_indexes(db)
+        elif args.command == "status":
+            applied = await applied_versions(db)
+            for migration in discover_migrations():
+                state = "applied" if migration.version in applied else "pending"
+                print(f"{migration.version:03d} {migration.name}: {state}")
+    finally:
+        await MongoDB.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.migrations", description="Database schema management")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    upgrade = subparsers.add_parser("upgrade", help="reconcile indexes and apply pending migrations")
+    upgrade.add_argument("--target", type=int, default=None, help="highest migration version to apply")
+    subparsers.add_parser("indexes", help="reconcile indexes only")
+    subparsers.add_parser("status", help="list migrations and whether they are applied")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
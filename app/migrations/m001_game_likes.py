@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime, timezone
+
+from pymongo.errors import BulkWriteError
+
+from app.core.logger import logger
+
+
+async def upgrade(db) -> None:
+    """
+    Moves the embedded games.likes arrays into the game_likes collection.
+
+    Copies every embedded like, recomputes like_count from game_likes and
+    removes the array from the game document. Relies on the unique
+    game_likes index from app.core.indexes to skip likes copied before.
+    Embedded likes carry no date, so the copies are flagged as backfilled
+    and left out of trending.
+
+    Args:
+        db: The AsyncIOMotorDatabase to migrate
+    """
+    migrated = 0
+    async for game in db.games.find({"likes": {"$exists": True}}, {"likes": 1}):
+        user_ids = set(game.get("likes") or [])
+        if user_ids:
+            now = datetime.now(timezone.utc)
+            try:
+                await db.game_likes.insert_many(
+                    [
+                        {
+                            "_id": str(uuid.uuid4()), "game_id": game["_id"], "user_id": user_id,
+                            "created_at": now, "backfilled": True,
+                        }
+                        for user_id in user_ids
+                    ],
+                    ordered=False,
+                )
+            except BulkWriteError as e:
+                duplicates = [error for error in e.details["writeErrors"] if error["code"] == 11000]
+                if len(duplicates) != len(e.details["writeErrors"]):
+                    raise
+
+        like_count = await db.game_likes.count_documents({"game_id": game["_id"]})
+        await db.games.update_one(
+            {"_id": game["_id"]},
+            {"$set": {"like_count": like_count}, "$unset": {"likes": ""}}
+        )
+        migrated += 1
+
+    logger.info(f"Migrated likes of {migrated} games into game_likes")
+
@@ -0,0 +1,15 @@
+from app.core.logger import logger
+
+
+async def upgrade(db) -> None:
+    """
+    Starts every game without a version field at version 1.
+
+    Updates and deletions that pass expectedVersion match on the stored
+    version, so games written before the field existed need it set.
+
+    Args:
+        db: The AsyncIOMotorDatabase to migrate
+    """
+    result = await db.games.update_many({"version": {"$exists": False}}, {"$set": {"version": 1}})
+    logger.info(f"Set the version of {result.modified_count} games")
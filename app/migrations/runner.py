@@ -0,0 +1,89 @@
+import importlib
+import pkgutil
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+import app.migrations
+from app.core.logger import logger
+
+_MODULE_PATTERN = re.compile(r"^m(\d{3})_(\w+)$")
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    A versioned schema migration, discovered from an app.migrations.mNNN_<name> module.
+    """
+    version: int
+    name: str
+    upgrade: Callable[..., Awaitable[None]]
+
+
+def discover_migrations() -> list[Migration]:
+    """
+    Finds every migration module, ordered by version.
+
+    Returns:
+        list[Migration]: The known migrations
+
+    Raises:
+        RuntimeError: If two modules share a version number
+    """
+    migrations = {}
+    for module_info in pkgutil.iter_modules(app.migrations.__path__):
+        match = _MODULE_PATTERN.match(module_info.name)
+        if match is None:
+            continue
+
+        version = int(match.group(1))
+        if version in migrations:
+            raise RuntimeError(f"Duplicate migration version {version}: {module_info.name}")
+
+        module = importlib.import_module(f"app.migrations.{module_info.name}")
+        migrations[version] = Migration(version, match.group(2), module.upgrade)
+
+    return [migrations[version] for version in sorted(migrations)]
+
+
+async def applied_versions(db) -> set[int]:
+    """
+    Returns the versions already recorded in the schema_migrations collection.
+
+    Args:
+        db: The AsyncIOMotorDatabase
+
+    Returns:
+        set[int]: Applied migration versions
+    """
+    return {doc["_id"] async for doc in db.schema_migrations.find({}, {"_id": 1})}
+
+
+async def migrate(db, target: int | None = None) -> list[Migration]:
+    """
+    Applies every pending migration up to target, in version order.
+
+    Args:
+        db: The AsyncIOMotorDatabase to migrate
+        target: Highest version to apply, None for all
+
+    Returns:
+        list[Migration]: The migrations that were applied
+    """
+    applied = await applied_versions(db)
+    done = []
+    for migration in discover_migrations():
+        if migration.version in applied or (target is not None and migration.version > target):
+            continue
+
+        logger.info(f"Applying migration {migration.version:03d}_{migration.name}")
+        await migration.upgrade(db)
+        await db.schema_migrations.insert_one({
+            "_id": migration.version,
+            "name": migration.name,
+            "applied_at": datetime.now(timezone.utc),
+        })
+        done.append(migration)
+
+    return done
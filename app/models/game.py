@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, HttpUrl, model_validator
 import uuid
 
 class Game(BaseModel):
@@ -17,9 +17,10 @@ class Game(BaseModel):
     cover_image_url: HttpUrl
     created_at: datetime = datetime.now(timezone.utc)
     updated_at: datetime = datetime.now(timezone.utc)
-    likes: list[str] = []
+    like_count: int = 0
     trailer: HttpUrl | None = None
     collage: list[HttpUrl] = []
+    version: int = 1
 
     @classmethod
     def create(cls, **data):
@@ -37,4 +38,30 @@ class Game(BaseModel):
             created_at=datetime.now(timezone.utc),
             updated_at=datetime.now(timezone.utc),
             **data
-        )
\ No newline at end of file
+        )
+
+
+# Game fields that may be cleared by setting them to null.
+NULLABLE_GAME_FIELDS = frozenset({"description", "trailer"})
+
+
+class GameChanges(BaseModel):
+    """
+    Pydantic model of a partial Game update. Only the fields that were set are applied.
+    """
+    name: str | None = None
+    type: str | None = None
+    publisher_name: str | None = None
+    external_game_id: str | None = None
+    description: str | None = None
+    is_featured: bool | None = None
+    cover_image_url: HttpUrl | None = None
+    trailer: HttpUrl | None = None
+    collage: list[HttpUrl] | None = None
+
+    @model_validator(mode="after")
+    def _reject_nulls(self) -> "GameChanges":
+        for field_name in self.model_fields_set - NULLABLE_GAME_FIELDS:
+            if getattr(self, field_name) is None:
+                raise ValueError(f"{field_name} cannot be null")
+        return self
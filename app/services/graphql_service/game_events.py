@@ -0,0 +1,119 @@
+import asyncio
+from dataclasses import dataclass
+
+from pymongo.errors import PyMongoError
+
+from app.core.broadcast import Broadcaster
+from app.core.config import settings
+from app.core.database import MongoDB
+from app.core.logger import logger
+from app.enums.game_event_type import GameEventType
+from app.services.graphql_service.gql_game_service import GqlGameService
+
+
+@dataclass(frozen=True)
+class GameEvent:
+    """
+    A change to one game, as delivered to subscriptions.
+    """
+    type: GameEventType
+    game_id: str
+    like_count: int | None = None
+
+
+# Shared by every subscription served by this worker.
+game_events: Broadcaster[GameEvent] = Broadcaster(settings.subscription_queue_size)
+
+_change_stream_task: asyncio.Task | None = None
+
+
+def publish_game_event(event_type: GameEventType, game_id: str, like_count: int | None = None) -> None:
+    """
+    Publishes a change made by this worker.
+
+    Does nothing when the change stream is the event source, since it
+    reports the same write to every worker, this one included.
+
+    Args:
+        event_type: What happened to the game
+        game_id: The ID of the game
+        like_count: The new like count, for liked events
+    """
+    if settings.game_events_source == "local":
+        game_events.publish(GameEvent(event_type, game_id, like_count))
+
+
+def event_from_change(change: dict) -> GameEvent | None:
+    """
+    Maps a change stream document of the games collection to an event.
+
+    Args:
+        change: The change event returned by watch()
+
+    Returns:
+        GameEvent | None: The event, None for operations subscriptions do not care about
+    """
+    operation = change.get("operationType")
+    game_id = (change.get("documentKey") or {}).get("_id")
+    if game_id is None:
+        return None
+    if operation == "insert":
+        return GameEvent(GameEventType.created, game_id)
+    if operation == "delete":
+        return GameEvent(GameEventType.deleted, game_id)
+    if operation in ("update", "replace"):
+        description = change.get("updateDescription") or {}
+        updated = description.get("updatedFields") or {}
+        if set(updated) - {"updated_at"} == {"like_count"} and not description.get("removedFields"):
+            return GameEvent(GameEventType.liked, game_id, updated["like_count"])
+        return GameEvent(GameEventType.updated, game_id)
+    return None
+
+
+async def watch_game_changes() -> None:
+    """
+    Publishes every change to the games collection, resuming after errors.
+
+    Also drops changed games from this worker's cache, keeps new reads from
+    joining ones issued before the change and re-reads the catalog version,
+    since the write may have come from another worker.
+    """
+    resume_token = None
+    while True:
+        try:
+            async with MongoDB.get_db().games.watch(resume_after=resume_token) as stream:
+                async for change in stream:
+                    resume_token = stream.resume_token
+                    event = event_from_change(change)
+                    if event is None:
+                        continue
+                    GqlGameService.forget_games([event.game_id])
+                    game_events.publish(event)
+        except PyMongoError as e:
+            logger.error(f"Games change stream failed, retrying in {settings.change_stream_retry_seconds}s: {e}")
+            await asyncio.sleep(settings.change_stream_retry_seconds)
+
+
+async def start_game_events() -> None:
+    """
+    Startup hook starting the change stream, when it is the configured event source.
+    Should be registered after MongoDB.connect.
+    """
+    global _change_stream_task
+    if settings.game_events_source == "change_stream" and _change_stream_task is None:
+        _change_stream_task = asyncio.create_task(watch_game_changes())
+
+
+async def stop_game_events() -> None:
+    """
+    Shutdown hook stopping the change stream.
+    Should be registered before MongoDB.close.
+    """
+    global _change_stream_task
+    if _change_stream_task is not None:
+        _change_stream_task.cancel()
+        try:
+            await _change_stream_task
+        except asyncio.CancelledError:
+            pass
+        _change_stream_task = None
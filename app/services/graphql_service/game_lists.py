@@ -0,0 +1,205 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from pymongo.errors import PyMongoError
+
+from app.core.config import settings
+from app.core.database import MongoDB
+from app.core.logger import logger
+from app.enums.trending_window import TrendingWindow
+
+TRENDING_WINDOWS = {
+    TrendingWindow.day: timedelta(days=1),
+    TrendingWindow.week: timedelta(days=7),
+    TrendingWindow.month: timedelta(days=30),
+}
+
+_refresh_task: asyncio.Task | None = None
+
+
+def _aware(value: datetime) -> datetime:
+    """Reads naive datetimes returned by the driver as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class RankedList:
+    """
+    Scores of the candidate games of one list, ranked lazily after a change.
+    """
+    def __init__(self, scores: dict[str, int] | None = None):
+        self.scores = scores or {}
+        self._ranked: list[str] | None = None
+
+    def set(self, game_id: str, score: int) -> None:
+        self.scores[game_id] = score
+        self._ranked = None
+
+    def add(self, game_id: str, delta: int) -> None:
+        score = self.scores.get(game_id, 0) + delta
+        if score > 0:
+            self.set(game_id, score)
+        else:
+            self.discard(game_id)
+
+    def discard(self, game_id: str) -> None:
+        if self.scores.pop(game_id, None) is not None:
+            self._ranked = None
+
+    def top(self, count: int) -> list[str]:
+        """
+        Returns the best ranked game IDs, highest score first and ties by descending ID.
+
+        Args:
+            count: Maximum number of IDs
+
+        Returns:
+            list[str]: The game IDs
+        """
+        if self._ranked is None:
+            ranked = sorted(self.scores.items(), key=lambda item: (item[1], item[0]), reverse=True)
+            self._ranked = [game_id for game_id, _ in ranked[:settings.game_lists_size]]
+        return self._ranked[:count]
+
+
+class GameLists:
+    """
+    Materialized featured and trending game lists, kept in memory by each worker.
+
+    Rebuilt from MongoDB every game_lists_refresh_seconds and patched in
+    between by this worker's writes, so serving a list costs no query
+    beyond loading its games. Writes made by other workers show up at the
+    next rebuild. Each list keeps up to game_lists_candidates games, more
+    than it serves, so games can climb into it between rebuilds.
+
+    Featured games are ranked by like count. Trending games are ranked by
+    likes received within the window, leaving out likes backfilled by
+    migration 001, whose date is only when they were copied.
+    """
+    featured: RankedList = RankedList()
+    trending: dict[TrendingWindow, RankedList] = {window: RankedList() for window in TrendingWindow}
+    built_at: float | None = None
+    _build_lock = asyncio.Lock()
+    _stale = asyncio.Event()
+
+    @classmethod
+    async def rebuild(cls) -> None:
+        """Recomputes every list from the games and game_likes collections."""
+        db = MongoDB.get_catalog_db()
+        cursor = db.games.find({"is_featured": True}, {"like_count": 1}).sort(
+            [("like_count", -1), ("_id", -1)]
+        ).limit(settings.game_lists_candidates)
+        featured = RankedList({doc["_id"]: doc.get("like_count", 0) async for doc in cursor})
+
+        now = datetime.now(timezone.utc)
+        trending = {}
+        for window, length in TRENDING_WINDOWS.items():
+            pipeline = [
+                {"$match": {"created_at": {"$gte": now - length}, "backfilled": {"$ne": True}}},
+                {"$group": {"_id": "$game_id", "likes": {"$sum": 1}}},
+                {"$sort": {"likes": -1, "_id": -1}},
+                {"$limit": settings.game_lists_candidates},
+            ]
+            cursor = db.game_likes.aggregate(pipeline)
+            trending[window] = RankedList({doc["_id"]: doc["likes"] async for doc in cursor})
+
+        cls.featured, cls.trending, cls.built_at = featured, trending, time.monotonic()
+
+    @classmethod
+    async def ensure_built(cls) -> None:
+        """Builds the lists on first use, for workers that have not finished their first rebuild yet."""
+        if cls.built_at is not None:
+            return
+        async with cls._build_lock:
+            if cls.built_at is None:
+                await cls.rebuild()
+
+    @classmethod
+    def request_rebuild(cls) -> None:
+        """Asks the background task to rebuild now, after writes too broad to patch in."""
+        cls._stale.set()
+
+    @classmethod
+    def game_written(cls, doc: dict) -> None:
+        """
+        Patches the featured list after a game was created or updated.
+
+        Args:
+            doc: The stored game, including is_featured and like_count
+        """
+        if doc.get("is_featured"):
+            cls.featured.set(doc["_id"], doc.get("like_count", 0))
+        else:
+            cls.featured.discard(doc["_id"])
+
+    @classmethod
+    def game_deleted(cls, game_id: str) -> None:
+        """
+        Removes a deleted game from every list.
+
+        Args:
+            game_id: The ID of the deleted game
+        """
+        cls.featured.discard(game_id)
+        for ranked in cls.trending.values():
+            ranked.discard(game_id)
+
+    @classmethod
+    def like_toggled(cls, game_id: str, delta: int, liked_at: datetime | None, like_count: int | None) -> None:
+        """
+        Patches the lists after a like was added or removed.
+
+        Args:
+            game_id: The ID of the game
+            delta: The change in the game's like count (-1, 0 or 1)
+            liked_at: When the added or removed like was made
+            like_count: The game's like count after the change, if known
+        """
+        if like_count is not None and game_id in cls.featured.scores:
+            cls.featured.set(game_id, like_count)
+        if delta == 0 or liked_at is None:
+            return
+
+        age = datetime.now(timezone.utc) - _aware(liked_at)
+        for window, length in TRENDING_WINDOWS.items():
+            if age <= length:
+                cls.trending[window].add(game_id, delta)
+
+
+async def refresh_game_lists() -> None:
+    """Rebuilds the lists periodically, or sooner when a rebuild is requested."""
+    while True:
+        try:
+            await GameLists.rebuild()
+        except PyMongoError as e:
+            logger.error(f"Could not rebuild the game lists: {e}")
+        try:
+            await asyncio.wait_for(GameLists._stale.wait(), settings.game_lists_refresh_seconds)
+        except asyncio.TimeoutError:
+            pass
+        GameLists._stale.clear()
+
+
+async def start_game_lists() -> None:
+    """
+    Startup hook starting the periodic rebuild.
+    Should be registered after MongoDB.connect.
+    """
+    global _refresh_task
+    if _refresh_task is None:
+        _refresh_task = asyncio.create_task(refresh_game_lists())
+
+
+async def stop_game_lists() -> None:
+    """
+    Shutdown hook stopping the periodic rebuild.
+    Should be registered before MongoDB.close.
+    """
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
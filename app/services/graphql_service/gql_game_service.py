@@ -1,7 +1,72 @@
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.core.cache import TTLCache
+from app.core.catalog_version import CatalogVersion
+from app.core.config import settings
 from app.core.database import MongoDB
-from app.models.game import Game
+from app.core.invalidation import invalidation_bus
+from app.core.pagination import decode_cursor, keyset_filter
+from app.core.singleflight import SingleFlight, freeze
+from app.enums.game_sort import GameSortField, SortDirection
+from app.enums.invalidation_scope import InvalidationScope
+from app.graphql.exceptions import VersionConflictError
+from app.graphql.type import GameType
+from app.models.game import Game, GameChanges
+from app.services.graphql_service.game_lists import GameLists
+from app.services.graphql_service.gql_like_service import GqlLikeService
+
+def game_to_document(game: Game) -> dict:
+    """
+    Converts a game model into the document stored in the games collection.
+
+    Args:
+        game: The game model
+
+    Returns:
+        dict: The Mongo document, keyed by _id and with URLs as strings
+    """
+    doc = game.model_dump()
+    doc["_id"] = doc.pop("id")
+    doc["cover_image_url"] = str(doc["cover_image_url"])
+    doc["trailer"] = str(doc["trailer"]) if doc["trailer"] is not None else None
+    doc["collage"] = [str(url) for url in doc["collage"]]
+    return doc
+
+
+def changes_to_document(changes: GameChanges) -> dict:
+    """
+    Converts a partial game update into the fields to $set.
+
+    Args:
+        changes: The validated changes
+
+    Returns:
+        dict: The fields the client set, with URLs as strings
+    """
+    doc = changes.model_dump(exclude_unset=True)
+    for field_name in ("cover_image_url", "trailer"):
+        if doc.get(field_name) is not None:
+            doc[field_name] = str(doc[field_name])
+    if doc.get("collage") is not None:
+        doc["collage"] = [str(url) for url in doc["collage"]]
+    return doc
+
+
+def _chunks(items: list, size: int):
+    """Yields (offset, chunk) pairs of at most size items."""
+    for offset in range(0, len(items), size):
+        yield offset, items[offset:offset + size]
+
+
+# Turns the raw sort value stored in a cursor back into the type stored in Mongo.
+_SORT_VALUE_PARSERS = {
+    GameSortField.created_at: datetime.fromisoformat,
+    GameSortField.like_count: int,
+}
 
 
 class GqlGameService:
@@ -9,42 +74,225 @@ class GqlGameService:
     Service layer defining business logic for Game operations.
     Interacts with MongoDB.
     """
-    def __init__(self):
+    # Shared by every request handled by this worker.
+    cache: TTLCache = TTLCache(settings.game_cache_size, settings.game_cache_ttl_seconds)
+    # Concurrent identical reads in this worker share one query.
+    flights: SingleFlight = SingleFlight(settings.game_singleflight_enabled)
+
+    def __init__(self, gql_like_service: GqlLikeService, user_id: str | None = None):
         self.mongo_cls = MongoDB.get_db()
+        # Catalog reads may go to secondaries; writes always use mongo_cls.
+        self.read_db = MongoDB.get_catalog_db(user_id)
+        # Part of every flight key, so read-your-writes reads never join a read served by a secondary.
+        self.read_route = "catalog" if self.read_db is MongoDB.get_catalog_db() else "primary"
+        # Lookups by ID fill the shared cache, so they read the primary: a lagging secondary
+        # would put stale games back for everyone, the writer included.
+        if self.cache.enabled:
+            self.lookup_db, self.lookup_route = self.mongo_cls, "primary"
+        else:
+            self.lookup_db, self.lookup_route = self.read_db, self.read_route
+        self.gql_like_service = gql_like_service
+        self.user_id = user_id
 
-    async def get_game_by_id(self, game_id: str) -> Game | None:
+    @classmethod
+    def forget_games(cls, game_ids: Iterable[str]) -> None:
+        """
+        Drops state made stale by a write to games, which may have come from another worker.
+
+        Args:
+            game_ids: The IDs of the changed games
+        """
+        for game_id in game_ids:
+            cls.cache.invalidate(game_id)
+        cls.flights.forget()
+        CatalogVersion.expire()
+
+    async def _record_write(self, game_ids: Iterable[str]) -> None:
+        """
+        Bumps the catalog version, keeps this user's next reads on the primary
+        and tells the other workers which games changed.
+
+        Args:
+            game_ids: The IDs of the written games
+        """
+        self.flights.forget()
+        MongoDB.record_write(self.user_id)
+        await CatalogVersion.bump()
+        await invalidation_bus.publish(InvalidationScope.games, game_ids)
+
+    async def get_game_by_id(self, game_id: str, projection: dict[str, int] | None = None) -> GameType | None:
         """
         Retrieves a game document by its ID.
         
         Args:
             game_id: The unique identifier of the game
+            projection: Optional Mongo projection limiting the fetched fields
             
         Returns:
-            Game | None: The game model if found, None otherwise
+            GameType | None: The game if found, None otherwise
         """
-        game = await self.mongo_cls.games.find_one({"_id": game_id})
-        if game is not None:
-            game["id"] = game.pop("_id")
-            return Game(**game)
+        game = self.cache.get(game_id)
+        if game is None:
+            # Cached entries must serve every selection, so only project when caching is off.
+            projection = None if self.cache.enabled else projection
+            generation = self.cache.generation()
+            game = await self.flights.do(
+                ("game", self.lookup_route, game_id, freeze(projection)),
+                lambda: self.lookup_db.games.find_one({"_id": game_id}, projection),
+            )
+            if game is None:
+                return None
+
+            self.cache.set(game_id, game, generation=generation)
 
-        return None
+        return GameType.from_document(game)
 
 
-    async def list_games(self) -> list[Game]:
+    async def load_games(self, game_ids: list[str]) -> list[GameType | None]:
         """
-        Retrieves all games from the database.
-        
+        Batch load function for the per-request game DataLoader.
+
+        Serves what it can from the cache and fetches every remaining ID with
+        a single $in query, joining fetches of the same IDs already in flight.
+
+        Args:
+            game_ids: The IDs of the games to load
+
+        Returns:
+            list[GameType | None]: One entry per requested ID, None where the game does not exist
+        """
+        docs = {}
+        missing = []
+        for game_id in game_ids:
+            doc = self.cache.get(game_id)
+            if doc is None:
+                missing.append(game_id)
+            else:
+                docs[game_id] = doc
+
+        if missing:
+            generation = self.cache.generation()
+            fetched = await self.flights.do_many(
+                [("game", self.lookup_route, game_id, None) for game_id in missing], self._fetch_games
+            )
+            for (_, _, game_id, _), doc in fetched.items():
+                if doc is not None:
+                    self.cache.set(game_id, doc, generation=generation)
+                    docs[game_id] = doc
+
+        return [GameType.from_document(docs[game_id]) if game_id in docs else None for game_id in game_ids]
+
+    async def _fetch_games(self, keys: list[tuple]) -> dict[tuple, dict]:
+        """
+        Fetches the games behind a batch of flight keys with a single $in query.
+
+        Args:
+            keys: ("game", route, game ID, None) flight keys
+
+        Returns:
+            dict[tuple, dict]: The found documents keyed by flight key
+        """
+        keys_by_id = {key[2]: key for key in keys}
+        cursor = self.lookup_db.games.find({"_id": {"$in": list(keys_by_id)}})
+        return {keys_by_id[doc["_id"]]: doc async for doc in cursor}
+
+    async def list_games(
+            self,
+            first: int,
+            after: str | None = None,
+            projection: dict[str, int] | None = None,
+            filters: dict | None = None,
+            sort_field: GameSortField = GameSortField.created_at,
+            direction: SortDirection = SortDirection.desc,
+    ) -> tuple[list[GameType], bool]:
+        """
+        Retrieves one page of games matching the filters, in the requested order.
+
+        Uses a keyset seek on (sort_field, _id) so the cost of a page does not
+        depend on how deep into the catalog it is.
+
+        Args:
+            first: Maximum number of games to return
+            after: Opaque cursor of the last game of the previous page
+            projection: Optional Mongo projection limiting the fetched fields
+            filters: Equality filters on game fields
+            sort_field: The field to order by
+            direction: The sort direction
+
+        Returns:
+            tuple[list[GameType], bool]: The page of games and whether more games follow
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for another sort
+        """
+        query = dict(filters or {})
+        descending = direction is SortDirection.desc
+        if after is not None:
+            sort_value, game_id = decode_cursor(after)
+            try:
+                sort_value = _SORT_VALUE_PARSERS[sort_field](sort_value)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Cursor does not match sort field {sort_field.value}") from e
+            query.update(keyset_filter(sort_field.value, sort_value, game_id, descending))
+
+        order = -1 if descending else 1
+        sort = [(sort_field.value, order), ("_id", order)]
+        docs = await self.flights.do(
+            ("games", self.read_route, freeze(query), freeze(projection), freeze(sort), first),
+            lambda: self.read_db.games.find(query, projection).sort(sort).limit(first + 1).to_list(None),
+        )
+        games = [GameType.from_document(doc) for doc in docs]
+
+        has_next_page = len(games) > first
+        return games[:first], has_next_page
+
+    async def search_games(
+            self,
+            text: str,
+            first: int,
+            after: str | None = None,
+            projection: dict[str, int] | None = None,
+    ) -> tuple[list[tuple[GameType, float]], bool]:
+        """
+        Retrieves one page of games matching a full-text query, most relevant first.
+
+        Runs a single aggregation over the text_search index. Pages are
+        seeked on (text score, _id), so later pages do not skip over the
+        earlier ones.
+
+        Args:
+            text: The search terms, in MongoDB $text syntax
+            first: Maximum number of games to return
+            after: Opaque cursor of the last game of the previous page
+            projection: Optional Mongo projection limiting the fetched fields
+
         Returns:
-            list[Game]: A list of all game models
+            tuple[list[tuple[GameType, float]], bool]: The games with their scores and whether more games follow
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        games_list = self.mongo_cls.games.find()
-        games = []
-        async for doc in games_list:
-            doc["id"] = doc.pop("_id")
-            games.append(Game(**doc))
+        pipeline: list[dict] = [
+            {"$match": {"$text": {"$search": text}}},
+            {"$addFields": {"score": {"$meta": "textScore"}}},
+        ]
+        if after is not None:
+            score, game_id = decode_cursor(after)
+            if isinstance(score, bool) or not isinstance(score, (int, float)):
+                raise ValueError(f"Invalid cursor: {after}")
+            pipeline.append({"$match": keyset_filter("score", score, game_id)})
+        pipeline.append({"$sort": {"score": -1, "_id": -1}})
+        pipeline.append({"$limit": first + 1})
+        if projection:
+            pipeline.append({"$project": {**projection, "score": 1}})
 
-        return games
+        docs = await self.flights.do(
+            ("search", self.read_route, freeze(pipeline)),
+            lambda: self.read_db.games.aggregate(pipeline).to_list(None),
+        )
+        results = [(GameType.from_document(doc), doc["score"]) for doc in docs]
 
+        return results[:first], len(results) > first
 
     async def create_game(self, game: Game) -> Game:
         """
@@ -56,72 +304,293 @@ class GqlGameService:
         Returns:
             Game: The created game model
         """
-        doc = game.model_dump()
-        doc["_id"] = doc.pop("id")
-        doc["cover_image_url"] = str(doc.pop("cover_image_url"))
+        doc = game_to_document(game)
         await self.mongo_cls.games.insert_one(doc)
+        self.cache.invalidate(game.id)
+        GameLists.game_written(doc)
+        await self._record_write([game.id])
         return game
 
-    async def update_game(self, game_id: str, game: Game) -> Game | None:
+    async def update_game(
+            self,
+            game_id: str,
+            changes: GameChanges,
+            expected_version: int | None = None,
+            projection: dict[str, int] | None = None,
+    ) -> GameType | None:
         """
-        Updates an existing game document.
-        
+        Applies a partial update in a single find_one_and_update and bumps the game's version.
+
         Args:
             game_id: The ID of the game to update
-            game: The new game data (partial updates not yet fully supported by this signature)
-            
+            changes: The fields to change
+            expected_version: Version the client last read, None to skip the check
+            projection: Optional Mongo projection limiting the returned fields
+
         Returns:
-            Game | None: The updated game model if found, None otherwise
+            GameType | None: The updated game if found, None otherwise
+
+        Raises:
+            VersionConflictError: If the game exists at another version than expected_version
         """
-        doc = game
-        doc["cover_image_url"] = str(doc.pop("cover_image_url"))
-        doc["updated_at"] = datetime.now(timezone.utc)
+        query = {"_id": game_id}
+        if expected_version is not None:
+            query["version"] = expected_version
+        if projection is not None:
+            # Needed to patch the featured list.
+            projection = {**projection, "is_featured": 1, "like_count": 1}
         result = await self.mongo_cls.games.find_one_and_update(
-            {"_id": game_id},
-            {"$set": doc},
-            return_document= True
+            query,
+            {"$set": {**changes_to_document(changes), "updated_at": datetime.now(timezone.utc)}, "$inc": {"version": 1}},
+            projection=projection,
+            return_document=ReturnDocument.AFTER
         )
+        self.cache.invalidate(game_id)
 
         if not result:
+            await self._raise_on_version_conflict(game_id, expected_version)
             return None
 
-        result["id"] = result.pop("_id")
-        return Game(**result)
+        GameLists.game_written(result)
+        await self._record_write([game_id])
+        return GameType.from_document(result)
+
+    async def _raise_on_version_conflict(self, game_id: str, expected_version: int | None) -> None:
+        """
+        Tells a version mismatch from a missing game after a conditional write matched nothing.
+
+        Only runs on the failure path, so successful writes stay a single round trip.
+
+        Args:
+            game_id: The ID of the game
+            expected_version: The version the write required, None if it required none
+
+        Raises:
+            VersionConflictError: If the game exists at another version
+        """
+        if expected_version is None:
+            return
+        current = await self.mongo_cls.games.find_one({"_id": game_id}, {"version": 1})
+        if current is not None:
+            raise VersionConflictError(game_id, expected_version, current.get("version", 1))
+
+    async def create_games(self, games: list[Game]) -> dict[int, str]:
+        """
+        Inserts many games with unordered, chunked insert_many calls.
+
+        Args:
+            games: The game models to persist
+
+        Returns:
+            dict[int, str]: Error messages keyed by position in games, empty if all succeeded
+        """
+        errors = {}
+        docs = [game_to_document(game) for game in games]
+        for offset, chunk in _chunks(docs, settings.bulk_chunk_size):
+            try:
+                await self.mongo_cls.games.insert_many(chunk, ordered=False)
+            except BulkWriteError as e:
+                for error in e.details["writeErrors"]:
+                    errors[offset + error["index"]] = error["errmsg"]
+
+        for game in games:
+            self.cache.invalidate(game.id)
+        created = [doc for position, doc in enumerate(docs) if position not in errors]
+        for doc in created:
+            GameLists.game_written(doc)
+        if created:
+            await self._record_write([doc["_id"] for doc in created])
+        return errors
 
-    async def toggle_like_game(self, game_id: str, likes: list[str]) -> Game | None:
+    async def update_games(self, updates: list[tuple[str, GameChanges]]) -> dict[int, str]:
         """
-        Updates the list of likes for a game.
+        Applies many partial updates with unordered, chunked bulk_write calls.
+
+        Args:
+            updates: (game ID, changes) pairs; only the fields set in each change are written
+
+        Returns:
+            dict[int, str]: Error messages keyed by position in updates, empty if all succeeded
+        """
+        errors = {}
+        now = datetime.now(timezone.utc)
+        for offset, chunk in _chunks(updates, settings.bulk_chunk_size):
+            existing = await self._existing_ids([game_id for game_id, _ in chunk])
+            operations = []
+            positions = []
+            for position, (game_id, changes) in enumerate(chunk, start=offset):
+                if game_id not in existing:
+                    errors[position] = f"Game with id {game_id} not found"
+                    continue
+                operations.append(UpdateOne(
+                    {"_id": game_id},
+                    {"$set": {**changes_to_document(changes), "updated_at": now}, "$inc": {"version": 1}}
+                ))
+                positions.append(position)
+
+            if not operations:
+                continue
+            try:
+                await self.mongo_cls.games.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                for error in e.details["writeErrors"]:
+                    errors[positions[error["index"]]] = error["errmsg"]
+
+        for game_id, _ in updates:
+            self.cache.invalidate(game_id)
+        if len(errors) < len(updates):
+            # The written documents are not read back, so the featured list is recomputed instead.
+            GameLists.request_rebuild()
+            await self._record_write(
+                [game_id for position, (game_id, _) in enumerate(updates) if position not in errors]
+            )
+        return errors
+
+    async def delete_games(self, game_ids: list[str]) -> dict[int, str]:
+        """
+        Deletes many games, and their likes, in chunks.
+
+        Args:
+            game_ids: The IDs of the games to delete
+
+        Returns:
+            dict[int, str]: Error messages keyed by position in game_ids, empty if all succeeded
+        """
+        errors = {}
+        for offset, chunk in _chunks(game_ids, settings.bulk_chunk_size):
+            existing = await self._existing_ids(chunk)
+            for position, game_id in enumerate(chunk, start=offset):
+                if game_id not in existing:
+                    errors[position] = f"Game with id {game_id} not found"
+
+            if existing:
+                await self.mongo_cls.games.delete_many({"_id": {"$in": list(existing)}})
+                await self.gql_like_service.delete_likes_for_games(list(existing))
+                await self._record_deletions(list(existing))
+
+        for game_id in game_ids:
+            self.cache.invalidate(game_id)
+        deleted = [game_id for position, game_id in enumerate(game_ids) if position not in errors]
+        for game_id in deleted:
+            GameLists.game_deleted(game_id)
+        if deleted:
+            await self._record_write(deleted)
+        return errors
+
+    async def _record_deletions(self, game_ids: list[str]) -> None:
+        """
+        Leaves a tombstone per deleted game, so incremental exports report the deletion.
+
+        Args:
+            game_ids: The IDs of the deleted games
+        """
+        now = datetime.now(timezone.utc)
+        await self.mongo_cls.deleted_games.bulk_write(
+            [UpdateOne({"_id": game_id}, {"$set": {"deleted_at": now}}, upsert=True) for game_id in game_ids],
+            ordered=False,
+        )
+
+    async def _existing_ids(self, game_ids: list[str]) -> set[str]:
+        """
+        Returns which of the given game IDs exist.
+
+        Args:
+            game_ids: The IDs to check
+
+        Returns:
+            set[str]: The existing subset
+        """
+        cursor = self.mongo_cls.games.find({"_id": {"$in": game_ids}}, {"_id": 1})
+        return {doc["_id"] async for doc in cursor}
+
+    async def toggle_like_game(
+            self, game_id: str, user_id: str, projection: dict[str, int] | None = None
+    ) -> tuple[GameType | None, bool]:
+        """
+        Toggles a user's like and keeps the game's like_count in step.
+
+        The like itself lives in the game_likes collection; the game document
+        only carries the denormalized counter.
         
         Args:
             game_id: The ID of the game
-            likes: The new list of user IDs who liked the game
+            user_id: The ID of the user toggling the like
+            projection: Optional Mongo projection limiting the returned fields
             
         Returns:
-            Game | None: The updated game model if found, None otherwise
+            tuple[GameType | None, bool]: The updated game (None if not found) and whether the user now likes it
         """
+        delta, liked_at = await self.gql_like_service.toggle_like(game_id, user_id)
+        update = {"$inc": {"like_count": delta}}
+        if delta != 0:
+            # Lets incremental exports pick up the new like count.
+            update["$set"] = {"updated_at": datetime.now(timezone.utc)}
         result = await self.mongo_cls.games.find_one_and_update(
             {"_id": game_id},
-            {"$set": {"likes": likes}},
-            return_document=True
+            update,
+            projection=projection,
+            return_document=ReturnDocument.AFTER
         )
+        self.cache.invalidate(game_id)
 
         if not result:
-            return None
+            if delta > 0:
+                await self.gql_like_service.toggle_like(game_id, user_id)
+            return None, False
 
-        updated_likes = result.get("likes", [])
-        result["likes"] = updated_likes
-        result["id"] = str(result.pop("_id"))
-        return Game(**result)
+        if delta != 0:
+            GameLists.like_toggled(game_id, delta, liked_at, result.get("like_count"))
+            await self._record_write([game_id])
+        return GameType.from_document(result), delta >= 0
 
-    async def delete_game(self, game_id: str) -> bool:
+    async def get_games_by_ids(
+            self, game_ids: list[str], projection: dict[str, int] | None = None
+    ) -> dict[str, GameType]:
         """
-        Deletes a game document by ID.
-        
+        Retrieves several games in a single query.
+
+        Args:
+            game_ids: The IDs of the games to fetch
+            projection: Optional Mongo projection limiting the fetched fields
+
+        Returns:
+            dict[str, GameType]: The found games keyed by ID
+        """
+        cursor = self.read_db.games.find({"_id": {"$in": game_ids}}, projection)
+        return {doc["_id"]: GameType.from_document(doc) async for doc in cursor}
+
+    async def delete_game(
+            self,
+            game_id: str,
+            expected_version: int | None = None,
+            projection: dict[str, int] | None = None,
+    ) -> GameType | None:
+        """
+        Deletes a game in a single find_one_and_delete, then its likes.
+
         Args:
             game_id: The ID of the game to delete
-            
+            expected_version: Version the client last read, None to skip the check
+            projection: Optional Mongo projection limiting the returned fields
+
         Returns:
-            bool: True if a document was deleted, False otherwise
+            GameType | None: The deleted game if found, None otherwise
+
+        Raises:
+            VersionConflictError: If the game exists at another version than expected_version
         """
-        result = await self.mongo_cls.games.delete_one({"_id": game_id})
-        return result.deleted_count == 1
\ No newline at end of file
+        query = {"_id": game_id}
+        if expected_version is not None:
+            query["version"] = expected_version
+        result = await self.mongo_cls.games.find_one_and_delete(query, projection=projection)
+        self.cache.invalidate(game_id)
+
+        if not result:
+            await self._raise_on_version_conflict(game_id, expected_version)
+            return None
+
+        await self.gql_like_service.delete_likes_for_game(game_id)
+        await self._record_deletions([game_id])
+        GameLists.game_deleted(game_id)
+        await self._record_write([game_id])
+        return GameType.from_document(result)
@@ -0,0 +1,118 @@
+import uuid
+from datetime import datetime, timezone
+
+from pymongo.errors import DuplicateKeyError
+
+from app.core.database import MongoDB
+from app.core.pagination import decode_datetime_cursor, keyset_filter
+
+
+class GqlLikeService:
+    """
+    Service layer for game likes.
+    Each like is a document in the game_likes collection, unique per (game_id, user_id).
+    """
+    def __init__(self):
+        self.mongo_cls = MongoDB.get_db()
+
+    async def toggle_like(self, game_id: str, user_id: str) -> tuple[int, datetime | None]:
+        """
+        Removes the user's like if present, otherwise adds it.
+
+        Args:
+            game_id: The ID of the game
+            user_id: The ID of the user toggling the like
+
+        Returns:
+            tuple[int, datetime | None]: The change in the game's like count (-1, 0 or 1)
+                and when the removed or added like was made, None if nothing changed or the
+                removed like was backfilled without a date
+        """
+        removed = await self.mongo_cls.game_likes.find_one_and_delete(
+            {"game_id": game_id, "user_id": user_id}, projection={"created_at": 1, "backfilled": 1}
+        )
+        if removed is not None:
+            return -1, None if removed.get("backfilled") else removed.get("created_at")
+
+        created_at = datetime.now(timezone.utc)
+        try:
+            await self.mongo_cls.game_likes.insert_one({
+                "_id": str(uuid.uuid4()),
+                "game_id": game_id,
+                "user_id": user_id,
+                "created_at": created_at,
+            })
+        except DuplicateKeyError:
+            # A concurrent toggle by the same user already inserted the like.
+            return 0, None
+        return 1, created_at
+
+    async def liked_game_ids(self, user_id: str, game_ids: list[str]) -> set[str]:
+        """
+        Returns which of the given games the user has liked.
+
+        Args:
+            user_id: The ID of the user
+            game_ids: The IDs of the games to check
+
+        Returns:
+            set[str]: The subset of game_ids liked by the user
+        """
+        if not game_ids:
+            return set()
+
+        cursor = self.mongo_cls.game_likes.find(
+            {"user_id": user_id, "game_id": {"$in": game_ids}},
+            {"_id": 0, "game_id": 1}
+        )
+        return {doc["game_id"] async for doc in cursor}
+
+    async def list_liked(self, user_id: str, first: int, after: str | None = None) -> tuple[list[dict], bool]:
+        """
+        Retrieves one page of a user's likes, most recent first.
+
+        Args:
+            user_id: The ID of the user
+            first: Maximum number of likes to return
+            after: Opaque cursor of the last like of the previous page
+
+        Returns:
+            tuple[list[dict], bool]: The like documents and whether more likes follow
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query: dict = {"user_id": user_id}
+        if after is not None:
+            created_at, like_id = decode_datetime_cursor(after)
+            query.update(keyset_filter("created_at", created_at, like_id))
+
+        cursor = self.mongo_cls.game_likes.find(query).sort([("created_at", -1), ("_id", -1)]).limit(first + 1)
+        likes = [doc async for doc in cursor]
+        return likes[:first], len(likes) > first
+
+    async def delete_likes_for_game(self, game_id: str) -> int:
+        """
+        Deletes every like of a game.
+
+        Args:
+            game_id: The ID of the game
+
+        Returns:
+            int: The number of likes deleted
+        """
+        result = await self.mongo_cls.game_likes.delete_many({"game_id": game_id})
+        return result.deleted_count
+
+    async def delete_likes_for_games(self, game_ids: list[str]) -> int:
+        """
+        Deletes every like of several games.
+
+        Args:
+            game_ids: The IDs of the games
+
+        Returns:
+            int: The number of likes deleted
+        """
+        result = await self.mongo_cls.game_likes.delete_many({"game_id": {"$in": game_ids}})
+        return result.deleted_count
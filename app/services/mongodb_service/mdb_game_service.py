@@ -0,0 +1,79 @@
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+
+from app.core.database import MongoDB
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        # Motor returns naive datetimes that are in UTC.
+        return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class MDBGameService:
+    """
+    Direct MongoDB access to the games collection for REST endpoints.
+    """
+    def __init__(self):
+        self.mongo_cls = MongoDB.get_catalog_db()
+
+    async def export_games(self, updated_since: datetime | None, batch_size: int) -> AsyncIterator[bytes]:
+        """
+        Streams the catalog as NDJSON, oldest update first.
+
+        Documents are serialized as they come off the cursor, one batch at a
+        time, so memory use depends on batch_size rather than on the catalog
+        size. The filter is inclusive so a consumer can resume from the last
+        updated_at it saw without missing games updated in the same instant.
+
+        With updated_since, games deleted since then are streamed first as
+        {"id", "deleted": true, "deleted_at"} tombstones. They come before the
+        games, so a game deleted and then created again ends up present.
+
+        Args:
+            updated_since: Only export games updated, or deleted, at or after this time
+            batch_size: Number of documents fetched per round trip and written per chunk
+
+        Yields:
+            bytes: Newline-terminated JSON objects, one per game or tombstone
+        """
+        query = {}
+        if updated_since is not None:
+            query["updated_at"] = {"$gte": updated_since}
+            tombstones = self.mongo_cls.deleted_games.find({"deleted_at": {"$gte": updated_since}}).sort(
+                [("deleted_at", 1), ("_id", 1)]
+            ).batch_size(batch_size)
+            async for chunk in self._stream(tombstones, batch_size, {"deleted": True}):
+                yield chunk
+
+        cursor = self.mongo_cls.games.find(query).sort([("updated_at", 1), ("_id", 1)]).batch_size(batch_size)
+        async for chunk in self._stream(cursor, batch_size):
+            yield chunk
+
+    @staticmethod
+    async def _stream(cursor, batch_size: int, extra: dict | None = None) -> AsyncIterator[bytes]:
+        """
+        Serializes a cursor as NDJSON chunks of batch_size lines, closing it when done.
+
+        Args:
+            cursor: The cursor to drain
+            batch_size: Number of lines per chunk
+            extra: Fields added to every object after its ID
+
+        Yields:
+            bytes: Newline-terminated JSON objects
+        """
+        lines = []
+        try:
+            async for doc in cursor:
+                item = {"id": doc.pop("_id"), **(extra or {}), **doc}
+                lines.append(json.dumps(item, default=_json_default, separators=(",", ":")))
+                if len(lines) >= batch_size:
+                    yield ("\n".join(lines) + "\n").encode()
+                    lines = []
+            if lines:
+                yield ("\n".join(lines) + "\n").encode()
+        finally:
+            await cursor.close()
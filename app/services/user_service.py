@@ -1,13 +1,24 @@
 from http import HTTPStatus
 from pydantic import EmailStr
+from pymongo.errors import DuplicateKeyError
 
-from app.core.security import Security
+from app.core.config import settings
+from app.core.security import HashingOverloadedError, Security
 from app.core.util import success_response, error_response
 from app.enums.user_type import UserType
 from app.models.user import User
 from app.services.mongodb_service.mdb_user_service import MDBUserService
 
 
+def _busy_response():
+    """Sheds a request that found every password hashing slot taken."""
+    return error_response(
+        "Server is busy, please retry.",
+        HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(settings.password_hash_retry_after_seconds)}
+    )
+
+
 class UserService:
 
     def __init__(self, mdb_user_service: MDBUserService):
@@ -15,21 +26,32 @@ class UserService:
 
     async def create_user(self, email: EmailStr, password: str, user_type: UserType):
         user = await self.mdb_user_service.get_user_by_email(email=email)
-        hashed_password = Security.hash_password(password)
+        if user is not None:
+            return error_response("User already exists.", HTTPStatus.CONFLICT)
 
-        if user is None:
-            user_obj = User(email=email, password=hashed_password)
-            await self.mdb_user_service.create_user(user_obj, user_type=user_type)
-            return success_response("User created successfully.", HTTPStatus.CREATED)
+        try:
+            hashed_password = await Security.hash_password_async(password)
+        except HashingOverloadedError:
+            return _busy_response()
 
-        return error_response("User already exists.", HTTPStatus.CONFLICT)
+        user_obj = User(email=email, password=hashed_password)
+        try:
+            await self.mdb_user_service.create_user(user_obj, user_type=user_type)
+        except DuplicateKeyError:
+            # A concurrent signup for the same email won the race past the check above.
+            return error_response("User already exists.", HTTPStatus.CONFLICT)
+        return success_response("User created successfully.", HTTPStatus.CREATED)
 
     async def authenticate_user(self, email: EmailStr, password: str):
         user = await self.mdb_user_service.get_user_by_email(email=email)
         if not user:
             return error_response("Invalid email or password.", HTTPStatus.UNAUTHORIZED)
-        if not Security.verify_password(password, user['password']):
+        try:
+            password_ok = await Security.verify_password_async(password, user['password'])
+        except HashingOverloadedError:
+            return _busy_response()
+        if not password_ok:
             return  error_response("Invalid email or password.", HTTPStatus.UNAUTHORIZED)
 
-        token = Security.create_access_token(user["email"], user["is_admin"])
+        token = Security.create_access_token(user["email"], user["is_admin"], user_id=user["id"])
         return success_response("User authenticated successfully.", HTTPStatus.OK, data={"token": token})
@@ -0,0 +1,66 @@
+"""
+Micro-benchmark of the per-game cost of turning a stored document into a GameType.
+
+Compares the old read path (Game model validation, model_dump, GameType) with
+GameType.from_document.
+
+    python -m benchmarks.bench_game_read_path --games 1000 --repeat 5
+"""
+import argparse
+import timeit
+from datetime import datetime, timezone
+
+from app.graphql.type import GameType
+from app.models.game import Game
+
+
+def make_document(index: int) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "_id": f"game-{index}",
+        "name": f"Game {index}",
+        "type": "rpg",
+        "publisher_name": "Publisher",
+        "external_game_id": str(index),
+        "description": "A game used for benchmarking the read path.",
+        "is_featured": index % 10 == 0,
+        "cover_image_url": f"https://cdn.example.com/covers/{index}.png",
+        "created_at": now,
+        "updated_at": now,
+        "like_count": index,
+        "trailer": f"https://cdn.example.com/trailers/{index}.mp4",
+        "collage": [f"https://cdn.example.com/collage/{index}/{n}.png" for n in range(5)],
+    }
+
+
+def validated_read(docs: list[dict]) -> list[GameType]:
+    games = []
+    for doc in docs:
+        doc = dict(doc)
+        doc["id"] = doc.pop("_id")
+        games.append(GameType(**Game(**doc).model_dump()))
+    return games
+
+
+def direct_read(docs: list[dict]) -> list[GameType]:
+    return [GameType.from_document(doc) for doc in docs]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=1000, help="documents converted per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per path; the best one is reported")
+    args = parser.parse_args()
+
+    docs = [make_document(index) for index in range(args.games)]
+    results = {}
+    for name, func in (("validated", validated_read), ("direct", direct_read)):
+        best = min(timeit.repeat(lambda: func(docs), number=1, repeat=args.repeat))
+        results[name] = best
+        print(f"{name:>10}: {best / args.games * 1e6:8.2f} us/game")
+
+    print(f"{'speedup':>10}: {results['validated'] / results['direct']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
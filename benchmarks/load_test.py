@@ -0,0 +1,338 @@
+"""
+Load test of the HTTP and GraphQL endpoints against an in-memory database.
+
+The real FastAPI application is driven in-process through httpx's ASGI
+transport, with benchmarks.memory_mongo standing in for MongoDB. The dataset
+and the request mix are derived from --seed, so two runs with the same
+arguments issue the same requests. Reported numbers include the stand-in's
+own query cost, so compare runs with each other rather than with production.
+
+    python -m benchmarks.load_test --games 5000 --users 200 --requests 1000 --concurrency 32
+    python -m benchmarks.load_test --scenarios games,game --json results.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from app.core.config import settings
+from app.core.database import MongoDB
+from app.core.indexes import ensure_indexes
+from app.core.loader import create_app
+from app.core.security import Security
+from benchmarks.memory_mongo import MemoryClient
+
+PASSWORD = "benchmark-password"
+GAME_TYPES = ["rpg", "fps", "strategy", "puzzle", "sports"]
+
+GAMES_QUERY = """
+query Games($first: Int, $filter: GameFilter, $sort: GameSort) {
+  games(first: $first, filter: $filter, sort: $sort) {
+    __typename
+    ... on ConnectionResponse {
+      data { edges { cursor node { id name type publisherName likeCount likedByMe } } pageInfo { hasNextPage endCursor } }
+    }
+  }
+}
+"""
+
+GAME_QUERY = """
+query Game($gameId: String!) {
+  game(gameId: $gameId) {
+    __typename
+    ... on SuccessResponse { data { id name description coverImageUrl likeCount likedByMe } }
+  }
+}
+"""
+
+FEATURED_QUERY = """
+query Featured($first: Int) {
+  featuredGames(first: $first) {
+    __typename
+    ... on SuccessResponse { data { id name coverImageUrl likeCount likedByMe } }
+  }
+}
+"""
+
+TOGGLE_LIKE_MUTATION = """
+mutation ToggleLike($gameId: String!) {
+  toggleLikeGame(gameId: $gameId) {
+    __typename
+    ... on SuccessResponse { data { id likeCount likedByMe } }
+  }
+}
+"""
+
+
+@dataclass
+class Dataset:
+    game_ids: list[str]
+    users: list[dict]
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    requests: int
+    errors: int
+    seconds: float
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+async def seed(games: int, users: int, likes_per_user: int, rng: random.Random) -> Dataset:
+    """
+    Installs the in-memory database and fills it with a deterministic dataset.
+
+    Args:
+        games: Number of games
+        users: Number of regular users, all sharing PASSWORD
+        likes_per_user: Number of distinct games each user likes
+        rng: Source of randomness
+
+    Returns:
+        Dataset: The IDs needed to build requests
+    """
+    MongoDB._client = MemoryClient()
+    db = MongoDB.get_db()
+    await ensure_indexes(db)
+
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    game_ids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(games)]
+    like_counts = dict.fromkeys(game_ids, 0)
+
+    password_hash = Security.hash_password(PASSWORD)
+    user_docs = [
+        {"_id": str(uuid.UUID(int=rng.getrandbits(128))), "email": f"user{index}@bench.example.com",
+         "password": password_hash, "is_admin": index == 0}
+        for index in range(users)
+    ]
+    await db.users.insert_many(user_docs)
+
+    like_docs = []
+    for user in user_docs:
+        for game_id in rng.sample(game_ids, min(likes_per_user, games)):
+            like_counts[game_id] += 1
+            like_docs.append({
+                "_id": str(uuid.UUID(int=rng.getrandbits(128))), "game_id": game_id, "user_id": user["_id"],
+                "created_at": start + timedelta(seconds=rng.randrange(365 * 24 * 3600)),
+            })
+    if like_docs:
+        await db.game_likes.insert_many(like_docs)
+
+    game_docs = []
+    for index, game_id in enumerate(game_ids):
+        created_at = start + timedelta(minutes=index)
+        game_docs.append({
+            "_id": game_id,
+            "name": f"Game {index}",
+            "type": rng.choice(GAME_TYPES),
+            "publisher_name": f"Publisher {rng.randrange(50)}",
+            "external_game_id": str(index),
+            "description": f"Seeded game number {index}.",
+            "is_featured": rng.random() < 0.1,
+            "cover_image_url": f"https://cdn.example.com/covers/{index}.png",
+            "trailer": None,
+            "collage": [f"https://cdn.example.com/collage/{index}/{n}.png" for n in range(3)],
+            "created_at": created_at,
+            "updated_at": created_at,
+            "like_count": like_counts[game_id],
+            "version": 1,
+        })
+    if game_docs:
+        await db.games.insert_many(game_docs)
+
+    return Dataset(game_ids=game_ids, users=[{"id": doc["_id"], "email": doc["email"]} for doc in user_docs])
+
+
+def user_headers(user: dict) -> dict:
+    token = Security.create_access_token(user["email"], False, user_id=user["id"])
+    return {"Authorization": f"Bearer {token}"}
+
+
+def graphql_ok(response: httpx.Response, field: str, typename: str) -> bool:
+    if response.status_code != 200:
+        return False
+    body = response.json()
+    return not body.get("errors") and (body.get("data") or {}).get(field, {}).get("__typename") == typename
+
+
+def build_scenarios(dataset: Dataset, rng: random.Random) -> dict[str, Callable[[httpx.AsyncClient], Awaitable[bool]]]:
+    """
+    Builds one request factory per scenario.
+
+    Args:
+        dataset: The seeded dataset
+        rng: Source of randomness for picking games, users and variables
+
+    Returns:
+        dict: Scenario name mapped to a coroutine function issuing one request and returning its success
+    """
+    headers = [user_headers(user) for user in dataset.users]
+    signups = iter(range(10 ** 9))
+
+    async def games(client: httpx.AsyncClient) -> bool:
+        variables: dict = {"first": 20}
+        if rng.random() < 0.5:
+            variables["filter"] = {"type": rng.choice(GAME_TYPES)}
+        if rng.random() < 0.5:
+            variables["sort"] = {"field": "like_count", "direction": "desc"}
+        response = await client.post(
+            "/api/graphql", json={"query": GAMES_QUERY, "variables": variables}, headers=rng.choice(headers)
+        )
+        return graphql_ok(response, "games", "ConnectionResponse")
+
+    async def game(client: httpx.AsyncClient) -> bool:
+        response = await client.post(
+            "/api/graphql",
+            json={"query": GAME_QUERY, "variables": {"gameId": rng.choice(dataset.game_ids)}},
+            headers=rng.choice(headers),
+        )
+        return graphql_ok(response, "game", "SuccessResponse")
+
+    async def featured(client: httpx.AsyncClient) -> bool:
+        response = await client.post(
+            "/api/graphql", json={"query": FEATURED_QUERY, "variables": {"first": 20}}, headers=rng.choice(headers)
+        )
+        return graphql_ok(response, "featuredGames", "SuccessResponse")
+
+    async def toggle_like(client: httpx.AsyncClient) -> bool:
+        index = rng.randrange(len(dataset.users))
+        variables = {"gameId": rng.choice(dataset.game_ids)}
+        response = await client.post(
+            "/api/graphql", json={"query": TOGGLE_LIKE_MUTATION, "variables": variables}, headers=headers[index]
+        )
+        return graphql_ok(response, "toggleLikeGame", "SuccessResponse")
+
+    async def login(client: httpx.AsyncClient) -> bool:
+        user = rng.choice(dataset.users)
+        response = await client.post("/api/auth/login", json={"email": user["email"], "password": PASSWORD})
+        return response.status_code == 200
+
+    async def signup(client: httpx.AsyncClient) -> bool:
+        email = f"signup{next(signups)}@bench.example.com"
+        response = await client.post("/api/auth/signup/user", json={"email": email, "password": PASSWORD})
+        return response.status_code == 201
+
+    return {
+        "games": games, "game": game, "featured": featured, "toggle_like": toggle_like, "login": login, "signup": signup
+    }
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client: httpx.AsyncClient, name: str, request: Callable[[httpx.AsyncClient], Awaitable[bool]],
+                       total: int, concurrency: int) -> ScenarioResult:
+    """
+    Issues a fixed number of requests with bounded concurrency.
+
+    Args:
+        client: Client bound to the application
+        name: Scenario name, for the report
+        request: Coroutine function issuing one request
+        total: Number of requests
+        concurrency: Number of requests in flight at once
+
+    Returns:
+        ScenarioResult: Throughput and latency percentiles
+    """
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                ok = await request(client)
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            errors += not ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    seconds = time.perf_counter() - started
+
+    latencies.sort()
+    return ScenarioResult(
+        scenario=name,
+        requests=total,
+        errors=errors,
+        seconds=round(seconds, 4),
+        throughput=round(total / seconds, 1) if seconds else 0.0,
+        p50_ms=round(percentile(latencies, 0.50) * 1000, 2),
+        p95_ms=round(percentile(latencies, 0.95) * 1000, 2),
+        p99_ms=round(percentile(latencies, 0.99) * 1000, 2),
+    )
+
+
+async def run(args: argparse.Namespace) -> list[ScenarioResult]:
+    # Every request comes from the same client address, which the auth limiter would throttle.
+    settings.rate_limit_enabled = args.rate_limit
+    rng = random.Random(args.seed)
+    dataset = await seed(args.games, args.users, args.likes_per_user, rng)
+    scenarios = build_scenarios(dataset, rng)
+
+    transport = httpx.ASGITransport(app=create_app())
+    results = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in args.scenarios:
+            total = args.auth_requests if name in ("login", "signup") else args.requests
+            if args.warmup:
+                await run_scenario(client, name, scenarios[name], args.warmup, args.concurrency)
+            results.append(await run_scenario(client, name, scenarios[name], total, args.concurrency))
+    await Security.shutdown_hash_executor()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=5000, help="seeded games")
+    parser.add_argument("--users", type=int, default=200, help="seeded users")
+    parser.add_argument("--likes-per-user", type=int, default=20, help="seeded likes per user")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per GraphQL scenario")
+    parser.add_argument("--auth-requests", type=int, default=200, help="requests per login/signup scenario")
+    parser.add_argument("--concurrency", type=int, default=32, help="requests in flight at once")
+    parser.add_argument("--warmup", type=int, default=50, help="unmeasured requests before each scenario")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the dataset and the request mix")
+    parser.add_argument(
+        "--scenarios", type=lambda value: value.split(","), default=["games", "game", "featured", "toggle_like", "login", "signup"],
+        help="comma-separated subset of games,game,featured,toggle_like,login,signup",
+    )
+    parser.add_argument(
+        "--rate-limit", action="store_true", help="keep the auth rate limiter on; all requests share one client IP"
+    )
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    print(f"{'scenario':>12} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for result in results:
+        print(
+            f"{result.scenario:>12} {result.requests:>9} {result.errors:>7} {result.throughput:>9.1f} "
+            f"{result.p50_ms:>8.2f} {result.p95_ms:>8.2f} {result.p99_ms:>8.2f}"
+        )
+    if args.json_path:
+        with open(args.json_path, "w") as file:
+            json.dump({"arguments": vars(args), "results": [asdict(result) for result in results]}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
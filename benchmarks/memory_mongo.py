@@ -0,0 +1,608 @@
+"""
+In-memory stand-in for the subset of the Motor API the application uses.
+
+It lets benchmarks drive the real services without a MongoDB server. It
+supports equality and comparison filters, $in/$nin/$exists/$or/$and,
+inclusion and exclusion projections, multi-key sorts, $set/$unset/$inc
+updates, upserts, bulk writes, unique indexes, simple aggregations and an
+approximation of $text search. It does not try to reproduce
+MongoDB performance: collections are scanned linearly except for lookups by
+_id.
+"""
+import re
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from pymongo.operations import DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
+from pymongo.results import (
+    BulkWriteResult, DeleteResult, InsertManyResult, InsertOneResult, UpdateResult,
+)
+
+_TEXT_SCORE = "__text_score"
+_TYPE_ORDER = {type(None): 0, int: 1, float: 1, str: 2, dict: 3, list: 4, bool: 6, datetime: 7}
+
+
+def _normalize(value: Any) -> Any:
+    """Stores datetimes the way MongoDB returns them: naive UTC with millisecond precision."""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
+
+
+def _type_rank(value: Any) -> int:
+    return _TYPE_ORDER.get(type(value), 5)
+
+
+def _sort_key(value: Any) -> tuple:
+    return (_type_rank(value), value if value is not None else 0)
+
+
+def _compare(left: Any, right: Any, operator: str) -> bool:
+    if _type_rank(left) != _type_rank(right) or left is None:
+        return False
+    if operator == "$lt":
+        return left < right
+    if operator == "$lte":
+        return left <= right
+    if operator == "$gt":
+        return left > right
+    return left >= right
+
+
+def _match_value(value: Any, condition: Any, present: bool) -> bool:
+    if not isinstance(condition, dict) or not any(key.startswith("$") for key in condition):
+        if isinstance(value, list) and not isinstance(condition, list):
+            return condition in value
+        return value == condition
+
+    for operator, operand in condition.items():
+        if operator == "$eq":
+            matched = _match_value(value, operand, present)
+        elif operator == "$ne":
+            matched = not _match_value(value, operand, present)
+        elif operator in ("$lt", "$lte", "$gt", "$gte"):
+            matched = present and _compare(value, operand, operator)
+        elif operator == "$in":
+            matched = any(_match_value(value, item, present) for item in operand)
+        elif operator == "$nin":
+            matched = not any(_match_value(value, item, present) for item in operand)
+        elif operator == "$exists":
+            matched = present == bool(operand)
+        else:
+            raise NotImplementedError(f"Unsupported query operator {operator}")
+        if not matched:
+            return False
+    return True
+
+
+def matches(doc: dict, query: dict) -> bool:
+    """
+    Checks if a document matches a MongoDB query filter.
+
+    Args:
+        doc: The stored document
+        query: The filter
+
+    Returns:
+        bool: True if the document matches
+    """
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(matches(doc, clause) for clause in condition):
+                return False
+        elif key == "$and":
+            if not all(matches(doc, clause) for clause in condition):
+                return False
+        elif key.startswith("$"):
+            raise NotImplementedError(f"Unsupported top-level operator {key}")
+        elif not _match_value(doc.get(key), condition, key in doc):
+            return False
+    return True
+
+
+def project(doc: dict, projection: dict | None) -> dict:
+    """
+    Applies an inclusion or exclusion projection to a copy of a document.
+
+    Args:
+        doc: The stored document
+        projection: The projection, None for the whole document
+
+    Returns:
+        dict: The projected copy
+    """
+    if not projection:
+        return _copy(doc)
+
+    include = {key for key, flag in projection.items() if flag and key != "_id"}
+    if include:
+        result = {key: _copy(doc[key]) for key in include if key in doc}
+        if projection.get("_id", 1) and "_id" in doc:
+            result["_id"] = doc["_id"]
+        return result
+
+    exclude = {key for key, flag in projection.items() if not flag}
+    return {key: _copy(value) for key, value in doc.items() if key not in exclude}
+
+
+def apply_update(doc: dict, update: dict) -> None:
+    """
+    Applies a $set/$unset/$inc update document in place.
+
+    Args:
+        doc: The stored document
+        update: The update operators
+    """
+    if isinstance(update, list):
+        raise NotImplementedError("Update pipelines are not supported")
+
+    for operator, fields in update.items():
+        for key, value in fields.items():
+            if operator == "$set":
+                doc[key] = _normalize(value)
+            elif operator == "$unset":
+                doc.pop(key, None)
+            elif operator == "$inc":
+                doc[key] = doc.get(key, 0) + value
+            else:
+                raise NotImplementedError(f"Unsupported update operator {operator}")
+
+
+class MemoryCursor:
+    """
+    Lazily evaluated find() result supporting sort, skip, limit and batch_size.
+    """
+    def __init__(self, collection: "MemoryCollection", query: dict, projection: dict | None):
+        self._collection = collection
+        self._query = query
+        self._projection = projection
+        self._sort: list[tuple[str, int]] = []
+        self._skip = 0
+        self._limit = 0
+        self._results: Iterator[dict] | None = None
+
+    def sort(self, key_or_list, direction: int | None = None) -> "MemoryCursor":
+        self._sort = [(key_or_list, direction or 1)] if isinstance(key_or_list, str) else list(key_or_list)
+        return self
+
+    def skip(self, count: int) -> "MemoryCursor":
+        self._skip = count
+        return self
+
+    def limit(self, count: int) -> "MemoryCursor":
+        self._limit = count
+        return self
+
+    def batch_size(self, size: int) -> "MemoryCursor":
+        return self
+
+    def _evaluate(self) -> list[dict]:
+        docs = self._collection._find_docs(self._query)
+        if self._sort and len({direction for _, direction in self._sort}) == 1:
+            keys = [key for key, _ in self._sort]
+            docs.sort(key=lambda doc: [_sort_key(doc.get(key)) for key in keys], reverse=self._sort[0][1] < 0)
+        else:
+            for key, direction in reversed(self._sort):
+                docs.sort(key=lambda doc: _sort_key(doc.get(key)), reverse=direction < 0)
+        docs = docs[self._skip:]
+        if self._limit:
+            docs = docs[:self._limit]
+        return [project(doc, self._projection) for doc in docs]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        if self._results is None:
+            self._results = iter(self._evaluate())
+        try:
+            return next(self._results)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    async def close(self) -> None:
+        self._results = iter(())
+
+    async def to_list(self, length: int | None = None) -> list[dict]:
+        docs = self._evaluate()
+        return docs if length is None else docs[:length]
+
+
+class MemoryCommandCursor:
+    """
+    Cursor over the already computed results of an aggregation.
+    """
+    def __init__(self, docs: list[dict]):
+        self._results = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self._results)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    async def close(self) -> None:
+        self._results = iter(())
+
+    async def to_list(self, length: int | None = None) -> list[dict]:
+        docs = list(self._results)
+        return docs if length is None else docs[:length]
+
+
+def _group(docs: list[dict], spec: dict) -> list[dict]:
+    def operand(doc: dict, value):
+        return doc.get(value[1:]) if isinstance(value, str) and value.startswith("$") else value
+
+    groups: dict = {}
+    for doc in docs:
+        key = operand(doc, spec["_id"])
+        group = groups.setdefault(key, {"_id": key, **{name: 0 for name in spec if name != "_id"}})
+        for name, accumulator in spec.items():
+            if name == "_id":
+                continue
+            (operator, value), = accumulator.items()
+            if operator != "$sum":
+                raise NotImplementedError(f"Unsupported accumulator {operator}")
+            group[name] += operand(doc, value) or 0
+    return list(groups.values())
+
+
+class MemoryCollection:
+    """
+    A single collection, with unique index enforcement.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._docs: dict[Any, dict] = {}
+        self._indexes: dict[str, dict] = {"_id_": {"key": [("_id", 1)], "v": 2}}
+        self._unique: dict[str, dict[tuple, Any]] = {}
+        self._text_weights: dict[str, int] | None = None
+
+    # Indexes
+
+    async def index_information(self) -> dict:
+        return {name: dict(info) for name, info in self._indexes.items()}
+
+    async def create_indexes(self, models: list) -> list[str]:
+        names = []
+        for model in models:
+            document = model.document
+            name = document["name"]
+            info = {"key": list(document["key"].items()), "v": 2}
+            info.update({key: value for key, value in document.items() if key not in ("name", "key")})
+            if "text" in document["key"].values():
+                # Reported the way MongoDB describes text indexes.
+                weights = document.get("weights") or {}
+                info["key"] = [("_fts", "text"), ("_ftsx", 1)]
+                info["weights"] = {
+                    field: weights.get(field, 1) for field, kind in document["key"].items() if kind == "text"
+                }
+                info.setdefault("default_language", "english")
+                self._text_weights = info["weights"]
+            self._indexes[name] = info
+            if info.get("unique"):
+                fields = [field for field, _ in info["key"]]
+                entries = {}
+                for doc in self._docs.values():
+                    entries[tuple(doc.get(field) for field in fields)] = doc["_id"]
+                self._unique[name] = entries
+            names.append(name)
+        return names
+
+    async def drop_index(self, name: str) -> None:
+        info = self._indexes.pop(name, None)
+        self._unique.pop(name, None)
+        if info is not None and info.get("weights"):
+            self._text_weights = None
+
+    def _unique_key(self, name: str, doc: dict) -> tuple:
+        return tuple(doc.get(field) for field, _ in self._indexes[name]["key"])
+
+    def _check_unique(self, doc: dict, ignore_id: Any = None) -> None:
+        if doc["_id"] in self._docs and doc["_id"] != ignore_id:
+            raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} index: _id_", 11000)
+        for name, entries in self._unique.items():
+            owner = entries.get(self._unique_key(name, doc))
+            if owner is not None and owner != doc["_id"]:
+                raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} index: {name}", 11000)
+
+    def _store(self, doc: dict) -> None:
+        self._docs[doc["_id"]] = doc
+        for name, entries in self._unique.items():
+            entries[self._unique_key(name, doc)] = doc["_id"]
+
+    def _remove(self, doc: dict) -> None:
+        del self._docs[doc["_id"]]
+        for name, entries in self._unique.items():
+            entries.pop(self._unique_key(name, doc), None)
+
+    # Reads
+
+    def _find_docs(self, query: dict | None) -> list[dict]:
+        query = _normalize(query or {})
+        id_condition = query.get("_id")
+        if id_condition is not None and not isinstance(id_condition, dict):
+            candidates = [self._docs[id_condition]] if id_condition in self._docs else []
+        elif isinstance(id_condition, dict) and set(id_condition) == {"$in"}:
+            candidates = [self._docs[doc_id] for doc_id in dict.fromkeys(id_condition["$in"]) if doc_id in self._docs]
+        else:
+            candidates = list(self._docs.values())
+        return [doc for doc in candidates if matches(doc, query)]
+
+    def find(self, filter: dict | None = None, projection: dict | None = None, **kwargs) -> MemoryCursor:
+        return MemoryCursor(self, filter or {}, projection)
+
+    async def find_one(self, filter: dict | None = None, projection: dict | None = None, **kwargs) -> dict | None:
+        docs = self._find_docs(filter)
+        return project(docs[0], projection) if docs else None
+
+    def _text_search(self, search: str) -> list[tuple[dict, float]]:
+        """
+        Approximates $text: every unquoted term is OR-ed, quoted phrases are
+        required and -terms exclude. Scores weigh term frequency by field weight.
+        """
+        if self._text_weights is None:
+            raise OperationFailure("text index required for $text query", 27)
+
+        phrases = [phrase.lower() for phrase in re.findall(r'"([^"]+)"', search)]
+        rest = re.sub(r'"[^"]*"', " ", search)
+        excluded = {term[1:].lower() for term in rest.split() if term.startswith("-") and len(term) > 1}
+        terms = {term.lower() for term in re.findall(r"\w+", " ".join(
+            term for term in rest.split() if not term.startswith("-")
+        ))}
+        terms.update(word for phrase in phrases for word in re.findall(r"\w+", phrase))
+
+        results = []
+        for doc in self._docs.values():
+            score = 0.0
+            texts = []
+            for field, weight in self._text_weights.items():
+                value = doc.get(field)
+                if not isinstance(value, str):
+                    continue
+                texts.append(value.lower())
+                words = re.findall(r"\w+", value.lower())
+                matches = sum(1 for word in words if word in terms)
+                if matches:
+                    score += weight * (0.5 + matches / (2 * len(words)))
+            text = " ".join(texts)
+            words = set(re.findall(r"\w+", text))
+            if score and all(phrase in text for phrase in phrases) and not words & excluded:
+                results.append((doc, score))
+        return results
+
+    def aggregate(self, pipeline: list[dict], **kwargs) -> MemoryCommandCursor:
+        """
+        Runs an aggregation made of $match, $addFields, $group, $sort, $skip, $limit and $project stages.
+        $group supports a top-level field, or a constant, as _id and $sum accumulators.
+        A $text $match is only allowed as the first stage, as in MongoDB.
+        """
+        stages = list(pipeline)
+        if stages and "$text" in stages[0].get("$match", {}):
+            match = dict(stages.pop(0)["$match"])
+            scored = self._text_search(match.pop("$text")["$search"])
+            docs = []
+            for doc, score in scored:
+                if matches(doc, _normalize(match)):
+                    doc = _copy(doc)
+                    doc[_TEXT_SCORE] = score
+                    docs.append(doc)
+        else:
+            docs = [_copy(doc) for doc in self._docs.values()]
+
+        for stage in stages:
+            (operator, argument), = stage.items()
+            if operator == "$match":
+                docs = [doc for doc in docs if matches(doc, _normalize(argument))]
+            elif operator == "$addFields":
+                for doc in docs:
+                    for key, value in argument.items():
+                        doc[key] = doc.get(_TEXT_SCORE) if value == {"$meta": "textScore"} else value
+            elif operator == "$group":
+                docs = _group(docs, argument)
+            elif operator == "$sort":
+                for key, direction in reversed(list(argument.items())):
+                    docs.sort(key=lambda doc: _sort_key(doc.get(key)), reverse=direction < 0)
+            elif operator == "$skip":
+                docs = docs[argument:]
+            elif operator == "$limit":
+                docs = docs[:argument]
+            elif operator == "$project":
+                docs = [project(doc, argument) for doc in docs]
+            else:
+                raise NotImplementedError(f"Unsupported aggregation stage {operator}")
+
+        for doc in docs:
+            doc.pop(_TEXT_SCORE, None)
+        return MemoryCommandCursor(docs)
+
+    async def count_documents(self, filter: dict, **kwargs) -> int:
+        return len(self._find_docs(filter))
+
+    # Writes
+
+    async def insert_one(self, document: dict, **kwargs) -> InsertOneResult:
+        doc = _normalize(document)
+        self._check_unique(doc)
+        self._store(doc)
+        return InsertOneResult(doc["_id"], True)
+
+    async def insert_many(self, documents: list[dict], ordered: bool = True, **kwargs) -> InsertManyResult:
+        inserted = []
+        errors = []
+        for index, document in enumerate(documents):
+            doc = _normalize(document)
+            try:
+                self._check_unique(doc)
+            except DuplicateKeyError as e:
+                errors.append({"index": index, "code": 11000, "errmsg": str(e), "op": document})
+                if ordered:
+                    break
+                continue
+            self._store(doc)
+            inserted.append(doc["_id"])
+
+        if errors:
+            raise BulkWriteError({
+                "writeErrors": errors, "writeConcernErrors": [], "nInserted": len(inserted),
+                "nUpserted": 0, "nMatched": 0, "nModified": 0, "nRemoved": 0, "upserted": [],
+            })
+        return InsertManyResult(inserted, True)
+
+    def _update_docs(self, docs: list[dict], update: dict) -> int:
+        for doc in docs:
+            updated = _copy(doc)
+            apply_update(updated, update)
+            self._check_unique(updated, ignore_id=doc["_id"])
+            self._remove(doc)
+            self._store(updated)
+        return len(docs)
+
+    def _upsert(self, filter: dict, update: dict) -> dict:
+        doc = {
+            key: value for key, value in _normalize(filter).items()
+            if not key.startswith("$") and not (isinstance(value, dict) and any(k.startswith("$") for k in value))
+        }
+        doc.setdefault("_id", ObjectId())
+        apply_update(doc, update)
+        self._check_unique(doc)
+        self._store(doc)
+        return doc
+
+    async def update_one(self, filter: dict, update: dict, upsert: bool = False, **kwargs) -> UpdateResult:
+        docs = self._find_docs(filter)[:1]
+        if not docs and upsert:
+            doc = self._upsert(filter, update)
+            return UpdateResult({"n": 1, "nModified": 0, "upserted": doc["_id"]}, True)
+        count = self._update_docs(docs, update)
+        return UpdateResult({"n": count, "nModified": count}, True)
+
+    async def update_many(self, filter: dict, update: dict, **kwargs) -> UpdateResult:
+        count = self._update_docs(self._find_docs(filter), update)
+        return UpdateResult({"n": count, "nModified": count}, True)
+
+    async def find_one_and_update(self, filter: dict, update: dict, projection: dict | None = None,
+                                  return_document: bool = ReturnDocument.BEFORE, upsert: bool = False,
+                                  **kwargs) -> dict | None:
+        docs = self._find_docs(filter)[:1]
+        if not docs:
+            if not upsert:
+                return None
+            doc = self._upsert(filter, update)
+            return project(doc, projection) if return_document else None
+        before = project(docs[0], projection)
+        self._update_docs(docs, update)
+        return project(self._docs[docs[0]["_id"]], projection) if return_document else before
+
+    async def find_one_and_delete(self, filter: dict, projection: dict | None = None, **kwargs) -> dict | None:
+        docs = self._find_docs(filter)[:1]
+        if not docs:
+            return None
+        self._remove(docs[0])
+        return project(docs[0], projection)
+
+    async def delete_one(self, filter: dict, **kwargs) -> DeleteResult:
+        docs = self._find_docs(filter)[:1]
+        for doc in docs:
+            self._remove(doc)
+        return DeleteResult({"n": len(docs)}, True)
+
+    async def delete_many(self, filter: dict, **kwargs) -> DeleteResult:
+        docs = self._find_docs(filter)
+        for doc in docs:
+            self._remove(doc)
+        return DeleteResult({"n": len(docs)}, True)
+
+    async def bulk_write(self, requests: list, ordered: bool = True, **kwargs) -> BulkWriteResult:
+        counts = {"nInserted": 0, "nMatched": 0, "nModified": 0, "nRemoved": 0, "nUpserted": 0, "upserted": []}
+        errors = []
+        for index, request in enumerate(requests):
+            try:
+                if isinstance(request, InsertOne):
+                    await self.insert_one(request._doc)
+                    counts["nInserted"] += 1
+                elif isinstance(request, (UpdateOne, UpdateMany)):
+                    docs = self._find_docs(request._filter)
+                    docs = docs[:1] if isinstance(request, UpdateOne) else docs
+                    if not docs and request._upsert:
+                        doc = self._upsert(request._filter, request._doc)
+                        counts["upserted"].append({"index": index, "_id": doc["_id"]})
+                        counts["nUpserted"] += 1
+                        continue
+                    matched = self._update_docs(docs, request._doc)
+                    counts["nMatched"] += matched
+                    counts["nModified"] += matched
+                elif isinstance(request, (DeleteOne, DeleteMany)):
+                    result = await (self.delete_one if isinstance(request, DeleteOne) else self.delete_many)(
+                        request._filter
+                    )
+                    counts["nRemoved"] += result.deleted_count
+                else:
+                    raise NotImplementedError(f"Unsupported bulk operation {type(request).__name__}")
+            except DuplicateKeyError as e:
+                errors.append({"index": index, "code": 11000, "errmsg": str(e)})
+                if ordered:
+                    break
+
+        if errors:
+            raise BulkWriteError({**counts, "writeErrors": errors, "writeConcernErrors": []})
+        return BulkWriteResult(counts, True)
+
+
+class MemoryDatabase:
+    """
+    A database whose collections are created on first access.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._collections: dict[str, MemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(name)
+        return self._collections[name]
+
+    def __getattr__(self, name: str) -> MemoryCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+
+class MemoryClient:
+    """
+    Drop-in replacement for AsyncIOMotorClient in MongoDB._client.
+    """
+    def __init__(self):
+        self._databases: dict[str, MemoryDatabase] = {}
+
+    def __getitem__(self, name: str) -> MemoryDatabase:
+        if name not in self._databases:
+            self._databases[name] = MemoryDatabase(name)
+        return self._databases[name]
+
+    def get_database(self, name: str, **kwargs) -> MemoryDatabase:
+        return self[name]
+
+    def close(self) -> None:
+        pass
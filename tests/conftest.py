@@ -0,0 +1,23 @@
+import asyncio
+
+import pytest
+
+from app.core.database import MongoDB
+from benchmarks.memory_mongo import MemoryClient
+
+
+@pytest.fixture
+def settle():
+    """Returns a coroutine function letting every ready task run a few steps."""
+    async def settle():
+        for _ in range(5):
+            await asyncio.sleep(0)
+    return settle
+
+
+@pytest.fixture
+def memory_mongo(monkeypatch):
+    """Points MongoDB at the in-memory stand-in used by the benchmarks."""
+    monkeypatch.setattr(MongoDB, "_client", MemoryClient())
+    monkeypatch.setattr(MongoDB, "_catalog_db", None)
+    return MongoDB.get_db()
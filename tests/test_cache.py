@@ -0,0 +1,45 @@
+from app.core.cache import TTLCache
+
+
+def test_set_skips_a_value_fetched_before_an_invalidation():
+    cache = TTLCache(maxsize=10, ttl=60)
+    generation = cache.generation()
+    cache.invalidate("game")
+    cache.set("game", "stale", generation=generation)
+    assert cache.get("game") is None
+
+    cache.set("game", "fresh", generation=cache.generation())
+    assert cache.get("game") == "fresh"
+
+
+def test_invalidating_another_key_does_not_block_set():
+    cache = TTLCache(maxsize=10, ttl=60)
+    generation = cache.generation()
+    cache.invalidate("other")
+    cache.set("game", "value", generation=generation)
+    assert cache.get("game") == "value"
+
+
+def test_set_skips_writes_older_than_a_forgotten_invalidation():
+    cache = TTLCache(maxsize=1, ttl=60)
+    generation = cache.generation()
+    cache.invalidate("game")
+    # Evicts the record of "game" from the invalidation log.
+    cache.invalidate("other")
+    cache.set("game", "stale", generation=generation)
+    assert cache.get("game") is None
+
+
+def test_clear_skips_writes_captured_before_it():
+    cache = TTLCache(maxsize=10, ttl=60)
+    generation = cache.generation()
+    cache.clear()
+    cache.set("game", "stale", generation=generation)
+    assert cache.get("game") is None
+
+
+def test_set_without_generation_always_writes():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.invalidate("game")
+    cache.set("game", "value")
+    assert cache.get("game") == "value"
@@ -0,0 +1,114 @@
+import asyncio
+
+from app.core.config import settings
+from app.core.invalidation import Invalidation, InvalidationBus, MemoryInvalidationBackend, MongoInvalidationBackend
+from app.enums.invalidation_scope import InvalidationScope
+
+
+def test_publish_reaches_every_other_bus(settle):
+    async def scenario():
+        backend = MemoryInvalidationBackend()
+        buses = [InvalidationBus(backend) for _ in range(3)]
+        received = {index: [] for index in range(3)}
+        for index, bus in enumerate(buses):
+            bus.subscribe(InvalidationScope.games, received[index].append)
+            await bus.start()
+        await settle()
+
+        await buses[0].publish(InvalidationScope.games, ["g1", "g2"])
+        await settle()
+        for bus in buses:
+            await bus.stop()
+
+        assert received == {0: [], 1: [("g1", "g2")], 2: [("g1", "g2")]}
+
+    asyncio.run(scenario())
+
+
+def test_dispatch_ignores_messages_from_the_same_bus():
+    bus = InvalidationBus(MemoryInvalidationBackend())
+    received = []
+    bus.subscribe(InvalidationScope.games, received.append)
+
+    bus.dispatch(Invalidation(InvalidationScope.games, ("g1",), bus.origin))
+    bus.dispatch(Invalidation(InvalidationScope.games, ("g2",), "another worker"))
+
+    assert received == [("g2",)]
+
+
+class FakeCursor:
+    """Tailable cursor over a shared list that dies once it has returned every document."""
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+        self.position = 0
+        self.alive = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        if self.position < len(self.docs):
+            self.position += 1
+            return self.docs[self.position - 1]
+        self.alive = False
+        raise StopAsyncIteration
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeCollection:
+    """The few capped collection operations MongoInvalidationBackend.listen uses."""
+    def __init__(self):
+        self.docs: list[dict] = []
+
+    async def find_one(self, *args, **kwargs) -> dict | None:
+        return self.docs[-1] if self.docs else None
+
+    async def count_documents(self, query: dict) -> int:
+        return sum(doc["_id"] == query["_id"] for doc in self.docs)
+
+    def find(self, *args, **kwargs) -> FakeCursor:
+        return FakeCursor(self.docs)
+
+
+def message(number: int) -> dict:
+    return {"_id": number, "scope": InvalidationScope.games.value, "keys": [f"g{number}"], "origin": "another worker"}
+
+
+def test_mongo_listener_resumes_after_the_last_message(monkeypatch, settle):
+    monkeypatch.setattr(settings, "invalidation_retry_seconds", 0)
+    collection = FakeCollection()
+    backend = MongoInvalidationBackend(collection_bytes=1024)
+
+    async def get_collection():
+        return collection
+
+    backend._collection = get_collection
+
+    async def scenario():
+        messages = backend.listen()
+
+        async def receive() -> str:
+            return (await asyncio.wait_for(anext(messages), 1)).keys[0]
+
+        # Messages published before the listener started are skipped.
+        collection.docs.extend([message(1), message(2)])
+        task = asyncio.ensure_future(receive())
+        await settle()
+        collection.docs.append(message(3))
+        assert await task == "g3"
+        assert backend._last_id == 3
+
+        # The cursor died after message 3; the new one skips up to _last_id.
+        collection.docs.append(message(4))
+        assert await receive() == "g4"
+
+        # Once _last_id is overwritten, the whole collection is replayed.
+        collection.docs[:] = [message(5), message(6)]
+        assert [await receive(), await receive()] == ["g5", "g6"]
+
+        await messages.aclose()
+
+    asyncio.run(scenario())
+
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.pagination import clamp_page_size, decode_cursor, encode_cursor, keyset_filter
+from app.enums.game_sort import GameSortField, SortDirection
+from app.models.game import Game
+from app.services.graphql_service.gql_game_service import GqlGameService, game_to_document
+from app.services.graphql_service.gql_like_service import GqlLikeService
+
+
+def test_cursor_round_trips_datetimes_as_iso_strings():
+    created_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor(created_at, "g1")) == (created_at.isoformat(), "g1")
+    assert decode_cursor(encode_cursor(7, "g2")) == (7, "g2")
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24=", encode_cursor(1, "g")[:-4]])
+def test_decode_cursor_rejects_malformed_cursors(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_keyset_filter_breaks_ties_on_id():
+    assert keyset_filter("like_count", 3, "g5") == {"$or": [
+        {"like_count": {"$lt": 3}},
+        {"like_count": 3, "_id": {"$lt": "g5"}},
+    ]}
+    assert keyset_filter("like_count", 3, "g5", descending=False)["$or"][1] == {"like_count": 3, "_id": {"$gt": "g5"}}
+
+
+def test_clamp_page_size():
+    assert clamp_page_size(None, default=20, maximum=100) == 20
+    assert clamp_page_size(500, default=20, maximum=100) == 100
+    with pytest.raises(ValueError):
+        clamp_page_size(0, default=20, maximum=100)
+
+
+def make_game(number: int, like_count: int) -> Game:
+    return Game(
+        id=f"g{number:02d}",
+        name=f"Game {number}",
+        type="action",
+        publisher_name="Publisher",
+        external_game_id=str(number),
+        cover_image_url="https://example.com/cover.png",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=number),
+        like_count=like_count,
+    )
+
+
+async def walk(service: GqlGameService, sort_field: GameSortField, direction: SortDirection) -> list[str]:
+    seen, after = [], None
+    while True:
+        games, has_next = await service.list_games(2, after=after, sort_field=sort_field, direction=direction)
+        seen.extend(game.id for game in games)
+        if not has_next:
+            return seen
+        last = games[-1]
+        after = encode_cursor(getattr(last, sort_field.value), last.id)
+
+
+def test_list_games_walks_every_game_once_in_order(memory_mongo):
+    async def scenario():
+        # Several games share a like count, so pages must split ties on _id.
+        games = [make_game(number, like_count=number % 2) for number in range(7)]
+        await memory_mongo.games.insert_many([game_to_document(game) for game in games])
+        GqlGameService.cache.clear()
+        service = GqlGameService(GqlLikeService())
+
+        by_created = await walk(service, GameSortField.created_at, SortDirection.desc)
+        assert by_created == [game.id for game in reversed(games)]
+
+        by_likes = await walk(service, GameSortField.like_count, SortDirection.asc)
+        assert by_likes == [game.id for game in sorted(games, key=lambda game: (game.like_count, game.id))]
+
+    asyncio.run(scenario())
+
+
+def test_list_games_rejects_a_cursor_issued_for_another_sort(memory_mongo):
+    async def scenario():
+        service = GqlGameService(GqlLikeService())
+        cursor = encode_cursor(datetime(2024, 1, 1, tzinfo=timezone.utc), "g01")
+        with pytest.raises(ValueError, match="does not match sort field like_count"):
+            await service.list_games(2, after=cursor, sort_field=GameSortField.like_count)
+
+    asyncio.run(scenario())
@@ -0,0 +1,41 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from app.graphql.persisted_queries import PersistedQueries
+from app.graphql.schema import schema
+
+QUERY = "{ __typename }"
+QUERY_HASH = hashlib.sha256(QUERY.encode()).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def empty_documents():
+    PersistedQueries.documents.clear()
+
+
+def execute(query: str | None, query_hash: str):
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+    return asyncio.run(schema.execute(query, operation_extensions=extensions))
+
+
+def test_unknown_hash_asks_for_the_query_text():
+    result = execute(None, QUERY_HASH)
+    assert [error.message for error in result.errors] == ["PersistedQueryNotFound"]
+    assert result.errors[0].extensions["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_registered_hash_runs_without_the_query_text():
+    assert not execute(QUERY, QUERY_HASH).errors
+    result = execute(None, QUERY_HASH)
+    assert not result.errors
+    assert result.data == {"__typename": "Query"}
+
+
+def test_hash_not_matching_the_query_is_rejected_and_not_registered():
+    wrong_hash = "0" * 64
+    result = execute(QUERY, wrong_hash)
+    assert [error.message for error in result.errors] == ["provided sha does not match query"]
+    assert result.errors[0].extensions["code"] == "BAD_REQUEST"
+    assert PersistedQueries.documents.get(wrong_hash) is None
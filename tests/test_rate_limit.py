@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from app.core import rate_limit
+from app.core.rate_limit import MemoryRateLimitBackend
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+def test_bucket_allows_a_burst_of_capacity_then_limits(clock):
+    async def scenario():
+        backend = MemoryRateLimitBackend(maxsize=10)
+        for _ in range(3):
+            assert await backend.consume("ip", capacity=3, refill_per_second=0.5) == 0
+        assert await backend.consume("ip", capacity=3, refill_per_second=0.5) == pytest.approx(2)
+
+    asyncio.run(scenario())
+
+
+def test_bucket_refills_at_the_configured_rate(clock):
+    async def scenario():
+        backend = MemoryRateLimitBackend(maxsize=10)
+        for _ in range(2):
+            await backend.consume("ip", capacity=2, refill_per_second=0.5)
+
+        clock.now += 1
+        assert await backend.peek("ip", capacity=2, refill_per_second=0.5) == pytest.approx(1)
+        clock.now += 1
+        assert await backend.peek("ip", capacity=2, refill_per_second=0.5) == 0
+        assert await backend.consume("ip", capacity=2, refill_per_second=0.5) == 0
+
+        # Refill never exceeds capacity.
+        clock.now += 100
+        for _ in range(2):
+            assert await backend.consume("ip", capacity=2, refill_per_second=0.5) == 0
+        assert await backend.consume("ip", capacity=2, refill_per_second=0.5) > 0
+
+    asyncio.run(scenario())
+
+
+def test_peek_does_not_take_a_token(clock):
+    async def scenario():
+        backend = MemoryRateLimitBackend(maxsize=10)
+        for _ in range(5):
+            assert await backend.peek("email", capacity=1, refill_per_second=1) == 0
+        assert await backend.consume("email", capacity=1, refill_per_second=1) == 0
+        assert await backend.peek("email", capacity=1, refill_per_second=1) == pytest.approx(1)
+
+    asyncio.run(scenario())
+
+
+def test_least_recently_used_buckets_are_dropped(clock):
+    async def scenario():
+        backend = MemoryRateLimitBackend(maxsize=1)
+        await backend.consume("a", capacity=1, refill_per_second=1)
+        await backend.consume("b", capacity=1, refill_per_second=1)
+        # "a" was dropped, so it starts full again.
+        assert await backend.consume("a", capacity=1, refill_per_second=1) == 0
+
+    asyncio.run(scenario())
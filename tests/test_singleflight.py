@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+class Gate:
+    """Coroutine function that counts its calls and blocks until released."""
+    def __init__(self, result=None, error: Exception | None = None):
+        self.result = result
+        self.error = error
+        self.calls = []
+        self.released = asyncio.Event()
+
+    async def __call__(self, *args):
+        self.calls.append(args)
+        await self.released.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_concurrent_callers_share_one_call(settle):
+    async def scenario():
+        flights = SingleFlight()
+        gate = Gate("game")
+        first = asyncio.create_task(flights.do("key", gate))
+        second = asyncio.create_task(flights.do("key", gate))
+        await settle()
+        gate.released.set()
+
+        assert await asyncio.gather(first, second) == ["game", "game"]
+        assert len(gate.calls) == 1
+        assert flights.stats() == {"calls": 1, "shared": 1, "in_flight": 0}
+
+    asyncio.run(scenario())
+
+
+def test_forget_starts_a_new_call_for_later_callers(settle):
+    async def scenario():
+        flights = SingleFlight()
+        before, after = Gate("old"), Gate("new")
+        early = asyncio.create_task(flights.do("key", before))
+        await settle()
+        flights.forget()
+        late = asyncio.create_task(flights.do("key", after))
+        await settle()
+        before.released.set()
+        after.released.set()
+
+        assert await early == "old"
+        assert await late == "new"
+        assert len(before.calls) == len(after.calls) == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call(settle):
+    async def scenario():
+        flights = SingleFlight()
+        gate = Gate("game")
+        cancelled = asyncio.create_task(flights.do("key", gate))
+        waiting = asyncio.create_task(flights.do("key", gate))
+        await settle()
+        cancelled.cancel()
+        await settle()
+        gate.released.set()
+
+        assert await waiting == "game"
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+    asyncio.run(scenario())
+
+
+def test_do_many_joins_keys_in_flight_and_fetches_the_rest_once(settle):
+    async def scenario():
+        flights = SingleFlight()
+        gate = Gate()
+        gate.result = {"a": 1, "b": 2, "c": 3}
+        first = asyncio.create_task(flights.do_many(["a", "b"], gate))
+        second = asyncio.create_task(flights.do_many(["b", "c", "missing"], gate))
+        await settle()
+        gate.released.set()
+
+        assert await first == {"a": 1, "b": 2}
+        assert await second == {"b": 2, "c": 3, "missing": None}
+        assert gate.calls == [(["a", "b"],), (["c", "missing"],)]
+
+    asyncio.run(scenario())
+
+
+def test_do_many_error_reaches_every_waiter(settle):
+    async def scenario():
+        flights = SingleFlight()
+        gate = Gate(error=ValueError("boom"))
+        first = asyncio.create_task(flights.do_many(["a", "b"], gate))
+        second = asyncio.create_task(flights.do_many(["b"], gate))
+        await settle()
+        gate.released.set()
+
+        for caller in (first, second):
+            with pytest.raises(ValueError, match="boom"):
+                await caller
+        assert flights.stats()["in_flight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_disabled_group_runs_every_call():
+    async def scenario():
+        flights = SingleFlight(enabled=False)
+        gate = Gate("game")
+        gate.released.set()
+
+        assert await asyncio.gather(flights.do("key", gate), flights.do("key", gate)) == ["game", "game"]
+        assert len(gate.calls) == 2
+
+    asyncio.run(scenario())